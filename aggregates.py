@@ -0,0 +1,190 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+# Cuboid dasar yang dibangun sekali per dataset hasil clustering. Agregat dengan
+# dimensi yang lebih sedikit diturunkan (roll-up) dari cuboid terkecil yang memuatnya.
+BASE_CUBOIDS = [
+    ("Industry", "Cluster"),
+    ("Location", "Industry", "Remote_Friendly"),
+    ("AI_Adoption_Level", "Industry", "Job_Growth_Projection"),
+    ("Location", "Industry", "Automation_Risk"),
+    ("Industry", "Job_Title", "Remote_Friendly"),
+    ("Company_Size",),
+]
+
+# Nilai numerik Automation_Risk, sama seperti pada grafik korelasi
+RISK_SCORES = {"Low": 1, "Medium": 2, "High": 3}
+
+HISTOGRAM_BINS = 30
+
+
+class AggregateCube:
+    """Agregat kecil (jumlah, rata-rata, kuantil, histogram) untuk seluruh visualisasi.
+
+    Setiap cuboid menyimpan Count, Salary_Sum dan Salary_SumSq per kombinasi dimensi,
+    sehingga rata-rata dan korelasi bisa dihitung tanpa membaca baris mentah lagi.
+    """
+
+    def __init__(self, df: pd.DataFrame, value="Salary_USD"):
+        self.value = value
+        self.rows = len(df)
+        self._cuboids = self._base_cuboids(df)
+        self._box = self._box_stats(df, "Company_Size")
+        self._edges = self._histogram_edges(df)
+        self._bin_counts = self._histogram_counts(df, "Job_Title")
+
+    def appended(self, batch: pd.DataFrame, combined: pd.DataFrame, scale=1.0, shift=0.0) -> "AggregateCube":
+        """Cube baru untuk data lama ditambah baris `batch`, tanpa mengagregasi ulang data lama.
+
+        Nilai lama dipetakan menjadi `scale * nilai + shift` (misalnya setelah statistik
+        standarisasi diperbarui); jumlah dan jumlah kuadrat ikut dipetakan secara eksak, dan
+        histogram memakai batas bin lama yang dipetakan sama. Kuantil boxplot tidak bisa
+        digabung dari ringkasan, sehingga dihitung ulang dari `combined`.
+        """
+        cube = copy.copy(self)
+        cube.rows = self.rows + len(batch)
+
+        cube._cuboids = {}
+        batch_cuboids = self._base_cuboids(batch)
+        for dims, cuboid in self._cuboids.items():
+            cuboid = cuboid.assign(
+                Salary_Sum=scale * cuboid["Salary_Sum"] + shift * cuboid["Count"],
+                Salary_SumSq=scale * scale * cuboid["Salary_SumSq"]
+                + 2 * scale * shift * cuboid["Salary_Sum"] + shift * shift * cuboid["Count"],
+            )
+            merged = pd.concat(
+                [schema.align_categories(cuboid), schema.align_categories(batch_cuboids[dims])],
+                ignore_index=True,
+            )
+            cube._cuboids[dims] = (
+                merged.groupby(list(dims), observed=True)[["Count", "Salary_Sum", "Salary_SumSq"]]
+                .sum()
+                .reset_index()
+            )
+
+        cube._box = self._box_stats(combined, "Company_Size")
+        if self._edges is None:
+            cube._edges = self._histogram_edges(batch)
+            cube._bin_counts = self._histogram_counts(batch, "Job_Title")
+        else:
+            cube._edges = scale * self._edges + shift
+            merged = pd.concat(
+                [schema.align_categories(self._bin_counts),
+                 schema.align_categories(cube._histogram_counts(batch, "Job_Title"))],
+                ignore_index=True,
+            )
+            cube._bin_counts = merged.groupby(["Job_Title", "Bin"], observed=True)["Count"].sum().reset_index()
+        return cube
+
+    def cuboid(self, *dims) -> pd.DataFrame:
+        """Count, Salary_Sum dan Salary_SumSq per kombinasi `dims`."""
+        candidates = [base for base in self._cuboids if set(dims) <= set(base)]
+        if not candidates:
+            raise KeyError(f"Tidak ada cuboid untuk dimensi {dims}")
+        base = min(candidates, key=lambda key: len(self._cuboids[key]))
+        cuboid = self._cuboids[base]
+        if len(base) == len(dims):
+            return cuboid.copy()
+        grouped = cuboid.groupby(list(dims), observed=True)
+        return grouped[["Count", "Salary_Sum", "Salary_SumSq"]].sum().reset_index()
+
+    def counts(self, *dims) -> pd.DataFrame:
+        cuboid = self.cuboid(*dims)
+        return cuboid.loc[cuboid["Count"] > 0, [*dims, "Count"]].reset_index(drop=True)
+
+    def mean(self, *dims) -> pd.DataFrame:
+        cuboid = self.cuboid(*dims)
+        cuboid = cuboid[cuboid["Count"] > 0]
+        cuboid = cuboid.assign(**{self.value: cuboid["Salary_Sum"] / cuboid["Count"]})
+        return cuboid[[*dims, self.value, "Count"]].reset_index(drop=True)
+
+    def mean_risk(self, *dims) -> pd.DataFrame:
+        """Rata-rata skor Automation_Risk (1=Low, 3=High) per kombinasi `dims`."""
+        cuboid = self.cuboid(*dims, "Automation_Risk")
+        score = cuboid["Automation_Risk"].map(RISK_SCORES).astype(float)
+        cuboid = cuboid.assign(Weighted=score * cuboid["Count"])
+        grouped = cuboid.groupby(list(dims), observed=True)[["Weighted", "Count"]].sum()
+        grouped = grouped[grouped["Count"] > 0]
+        grouped = grouped.assign(Automation_Risk=grouped["Weighted"] / grouped["Count"])
+        return grouped[["Automation_Risk", "Count"]].reset_index()
+
+    def risk_correlation(self) -> pd.DataFrame:
+        """Korelasi Pearson gaji dan Automation_Risk numerik dari momen teragregasi."""
+        cuboid = self.cuboid("Automation_Risk")
+        score = cuboid["Automation_Risk"].map(RISK_SCORES).astype(float)
+        known = score.notna()
+        cuboid, score = cuboid[known], score[known]
+
+        n = cuboid["Count"].sum()
+        sum_x, sum_xx = cuboid["Salary_Sum"].sum(), cuboid["Salary_SumSq"].sum()
+        sum_y = (score * cuboid["Count"]).sum()
+        sum_yy = (score * score * cuboid["Count"]).sum()
+        sum_xy = (score * cuboid["Salary_Sum"]).sum()
+        covariance = n * sum_xy - sum_x * sum_y
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = covariance / np.sqrt((n * sum_xx - sum_x ** 2) * (n * sum_yy - sum_y ** 2))
+
+        names = [self.value, "Automation_Risk_Numeric"]
+        return pd.DataFrame([[1.0, r], [r, 1.0]], index=names, columns=names)
+
+    def box_stats(self) -> pd.DataFrame:
+        return self._box.copy()
+
+    def histogram(self) -> pd.DataFrame:
+        if self._edges is None:
+            return pd.DataFrame(columns=["Job_Title", "Bin", "Count"])
+        centers = (self._edges[:-1] + self._edges[1:]) / 2
+        histogram = self._bin_counts.assign(Bin=centers[self._bin_counts["Bin"].to_numpy()])
+        histogram.attrs["bin_width"] = float(self._edges[1] - self._edges[0])
+        return histogram
+
+    def _base_cuboids(self, df):
+        salary = df[self.value].astype(np.float64)
+        frame = df.assign(Salary_Sum=salary, Salary_SumSq=salary * salary)
+
+        cuboids = {}
+        for dims in BASE_CUBOIDS:
+            grouped = frame.groupby(list(dims), observed=True)
+            cuboid = grouped[["Salary_Sum", "Salary_SumSq"]].sum()
+            cuboid.insert(0, "Count", grouped.size())
+            cuboids[dims] = cuboid.reset_index()
+        return cuboids
+
+    def _box_stats(self, df, dim):
+        # Statistik boxplot (kuartil dan pagar 1.5 IQR) per kategori
+        values = df[self.value].astype(np.float64)
+        grouped = values.groupby(df[dim], observed=True)
+        stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+        stats.columns = ["q1", "median", "q3"]
+        iqr = stats["q3"] - stats["q1"]
+
+        low = df[dim].map(stats["q1"] - 1.5 * iqr).astype(np.float64)
+        high = df[dim].map(stats["q3"] + 1.5 * iqr).astype(np.float64)
+        stats["lowerfence"] = values[values >= low].groupby(df[dim], observed=True).min()
+        stats["upperfence"] = values[values <= high].groupby(df[dim], observed=True).max()
+        stats["Count"] = grouped.size()
+        return stats.reset_index()
+
+    def _histogram_edges(self, df):
+        values = df[self.value].to_numpy(dtype=np.float64)
+        finite = np.isfinite(values)
+        if not finite.any():
+            return None
+        return np.histogram_bin_edges(values[finite], bins=HISTOGRAM_BINS)
+
+    def _histogram_counts(self, df, dim):
+        # Jumlah baris per (dim, nomor bin); nilai di luar batas masuk ke bin tepi
+        values = df[self.value].to_numpy(dtype=np.float64)
+        finite = np.isfinite(values)
+        if self._edges is None or not finite.any():
+            return pd.DataFrame({dim: pd.Series(dtype=df[dim].dtype), "Bin": [], "Count": []})
+        bins = np.clip(np.searchsorted(self._edges, values, side="right") - 1, 0, HISTOGRAM_BINS - 1)
+        counts = pd.Series(bins[finite]).groupby(
+            [df[dim].to_numpy()[finite], bins[finite]], observed=True
+        ).size()
+        counts.index.names = [dim, "Bin"]
+        return counts.rename("Count").reset_index()
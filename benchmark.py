@@ -0,0 +1,380 @@
+"""Benchmark setiap tahap analisis dengan data sintetis berskema sama dengan dataset asli.
+
+Untuk setiap ukuran, data dibangkitkan dan diukur di proses baru agar puncak memori
+tidak terbawa dari ukuran sebelumnya. Tahap yang diukur: ingest (cache dingin dan
+hangat), preprocessing, K-Means untuk satu k, Elbow Method, Silhouette, PCA, agregat
+visualisasi, serta setiap grafik (waktu dan ukuran payload JSON Plotly / PNG).
+
+Engine exact dibatasi sampai EXACT_MAX_ROWS baris: sweep DP-nya menyimpan tabel split
+(k, n) int64, sekitar 800 MB untuk 10 juta baris dengan k=10. Di atas batas itu tahap
+clustering ukuran tersebut diukur dengan engine minibatch dan dicatat di hasilnya.
+
+    python benchmark.py --sizes 10k 100k 1m 10m --output baseline.json
+    python benchmark.py --sizes 10k 100k --compare baseline.json   # exit 1 jika ada regresi
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import metrics
+import pipeline
+import rendering
+
+DEFAULT_SIZES = ("10k", "100k", "1m", "10m")
+FORMATS = ("parquet", "csv", "xlsx")
+
+# Batas jumlah baris data satu sheet Excel (tanpa baris judul)
+XLSX_MAX_ROWS = 1_048_575
+
+# Selisih relatif terhadap baseline yang masih dianggap wajar
+DEFAULT_TOLERANCE = 0.25
+
+# Selisih absolut minimum agar dihitung sebagai regresi (menyaring derau pengukuran)
+MIN_SECONDS_DELTA = 0.1
+MIN_RSS_DELTA = 32 * 1024 ** 2
+MIN_PAYLOAD_DELTA = 1024
+
+# Batas baris untuk engine exact (tabel split DP berukuran 8 * k * n byte); di atasnya
+# dipakai engine minibatch
+EXACT_MAX_ROWS = int(os.environ.get("TECHNO_BENCH_EXACT_MAX_ROWS", 2_000_000))
+
+# Interval pengambilan sampel RSS saat mencari puncak memori per tahap, dalam detik
+RSS_SAMPLE_INTERVAL = 0.005
+
+JOB_TITLES = {
+    # Jabatan dan rata-rata gajinya (USD), agar cluster gaji tidak sepenuhnya acak
+    "AI Researcher": 115_000,
+    "Cybersecurity Analyst": 95_000,
+    "Data Scientist": 105_000,
+    "HR Manager": 75_000,
+    "Marketing Specialist": 70_000,
+    "Operations Manager": 80_000,
+    "Product Manager": 100_000,
+    "Sales Manager": 85_000,
+    "Software Engineer": 100_000,
+    "UX Designer": 85_000,
+}
+INDUSTRIES = ["Education", "Energy", "Entertainment", "Finance", "Healthcare", "Manufacturing",
+              "Retail", "Tech", "Telecommunications", "Transportation"]
+LOCATIONS = ["Berlin", "Dubai", "London", "New York", "Paris", "San Francisco", "Singapore",
+             "Sydney", "Tokyo", "Toronto"]
+SKILLS = ["Cybersecurity", "Data Analysis", "JavaScript", "Machine Learning", "Marketing",
+          "Project Management", "Python", "Sales", "SQL", "UX/UI Design"]
+LEVELS = ["Low", "Medium", "High"]
+COMPANY_SIZES = ["Small", "Medium", "Large"]
+REMOTE = ["No", "Yes"]
+GROWTH = ["Decline", "Stable", "Growth"]
+
+
+def parse_size(text: str) -> int:
+    """'10k' → 10000, '1m' → 1000000; angka biasa juga diterima."""
+    text = text.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * multiplier)
+
+
+def synthetic_dataset(n: int, seed=0, missing=0.01) -> pd.DataFrame:
+    """Dataset acak dengan kolom dan nilai seperti dataset pasar kerja asli.
+
+    Kolom teks berisi string biasa seperti hasil membaca file upload, sehingga ingest,
+    skema kategori dan tokenisasi keterampilan ikut diukur. Sebagian kecil Salary_USD
+    dibuat NaN supaya preprocessing punya kerja.
+    """
+    rng = np.random.default_rng(seed)
+
+    def strings(values, codes):
+        # Setiap sel merujuk objek string yang sama per nilai, seperti daftar hasil parsing
+        return np.array(values, dtype=object)[codes]
+
+    def choice(values):
+        return strings(values, rng.integers(0, len(values), n, dtype=np.int8))
+
+    titles = list(JOB_TITLES)
+    title_codes = rng.integers(0, len(titles), n, dtype=np.int8)
+    salary = np.fromiter(JOB_TITLES.values(), dtype=np.float64)[title_codes] + rng.normal(0, 20_000, n)
+    salary[rng.random(n) < missing] = np.nan
+
+    return pd.DataFrame({
+        "Job_Title": strings(titles, title_codes),
+        "Industry": choice(INDUSTRIES),
+        "Company_Size": choice(COMPANY_SIZES),
+        "Location": choice(LOCATIONS),
+        "AI_Adoption_Level": choice(LEVELS),
+        "Automation_Risk": choice(LEVELS),
+        "Required_Skills": choice(SKILLS),
+        "Salary_USD": salary.round(2),
+        "Remote_Friendly": choice(REMOTE),
+        "Job_Growth_Projection": choice(GROWTH),
+    })
+
+
+def write_dataset(df: pd.DataFrame, path: Path) -> Path:
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    elif path.suffix == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
+    return path
+
+
+class _PeakRss:
+    """Mengambil sampel RSS di thread latar untuk mencatat puncak memori per tahap."""
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = metrics.rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, metrics.rss_bytes())
+
+    def reset(self) -> int:
+        self.peak = metrics.rss_bytes()
+        return self.peak
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _measure(sampler, stages, name, fn, *args, **kwargs):
+    before = sampler.reset()
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    seconds = time.perf_counter() - started
+    peak = max(sampler.peak, metrics.rss_bytes())
+    stages[name] = {"seconds": seconds, "peak_rss_bytes": peak, "rss_delta_bytes": peak - before}
+    return result
+
+
+def _fit_one(X, k, engine):
+    import clustering
+
+    if engine == "exact":
+        return clustering.KMeans1D(n_clusters=k).fit(X)
+    if engine == "minibatch":
+        return clustering.fit_minibatch(X, k)
+    return clustering._fit_sklearn(X, k)
+
+
+def run_size(n, engine="exact", file_format="parquet", k=3, seed=0,
+             render_mode=rendering.MODE_AUTO, max_workers=None, exact_max_rows=EXACT_MAX_ROWS) -> dict:
+    """Mengukur seluruh tahap untuk `n` baris sintetis di proses ini."""
+    import charts
+    import clustering
+    import features
+    from sklearn.decomposition import PCA
+
+    note = None
+    if engine == "exact" and n > exact_max_rows:
+        engine = "minibatch"
+        note = f"engine exact dilewati di atas {exact_max_rows:,} baris (tabel split DP 8·k·n byte)"
+
+    sampler = _PeakRss()
+    stages, figures = {}, {}
+    try:
+        raw = _measure(sampler, stages, "generate", synthetic_dataset, n, seed)
+        with tempfile.TemporaryDirectory(prefix="techno-bench-") as directory:
+            directory = Path(directory)
+            if file_format == "xlsx" and n > XLSX_MAX_ROWS:
+                stages["ingest_cold"] = stages["ingest_warm"] = {"skipped": f"lebih dari {XLSX_MAX_ROWS} baris"}
+            else:
+                path = write_dataset(raw, directory / f"synthetic.{file_format}")
+                cache = directory / "cache"
+                raw = _measure(sampler, stages, "ingest_cold", pipeline.load_dataset, path, cache_dir=cache)
+                raw = _measure(sampler, stages, "ingest_warm", pipeline.load_dataset, path, cache_dir=cache)
+
+        preprocessed = _measure(sampler, stages, "preprocess", pipeline.preprocess, raw)
+        del raw
+        encoder = features.FeatureEncoder(multi_feature=engine == "minibatch")
+        X = _measure(sampler, stages, "features", encoder.fit_transform, preprocessed)
+        model = _measure(sampler, stages, "kmeans", _fit_one, X, k, engine)
+        # Hash data berbeda per ukuran dan proses ini baru, jadi memo sweep selalu dingin
+        models = _measure(sampler, stages, "elbow_sweep", clustering.elbow_sweep,
+                          X, pipeline.ELBOW_RANGE, engine=engine, max_workers=max_workers)
+        silhouette = _measure(sampler, stages, "silhouette", clustering.silhouette, X, model.labels_)
+        stages["silhouette"]["method"] = silhouette.method
+
+        pca = PCA(n_components=1)
+        pca1 = _measure(sampler, stages, "pca", pca.fit_transform, X)[:, 0]
+        df = preprocessed.assign(Cluster=model.labels_.copy(), PCA1=pca1)
+        ctx = _measure(sampler, stages, "chart_context", charts.chart_context, df, render_mode)
+
+        builders = {
+            "Visualisasi PCA (1 Komponen)": lambda: charts.pca_figure(df, render_mode),
+            "Elbow Method": lambda: (charts.elbow_figure(models, [m.inertia_ for m in models.values()]), None),
+            **{title: lambda title=title: charts.build(title, ctx) for title in charts.CHARTS},
+        }
+        for title, build in builders.items():
+            chart = _measure(sampler, figures, title, build)[0]
+            figures[title]["payload_bytes"] = metrics.payload_bytes(chart)
+    finally:
+        sampler.close()
+
+    return {
+        "rows": n,
+        "engine": engine,
+        "note": note,
+        "rows_after_preprocessing": int(len(preprocessed)),
+        "stages": stages,
+        "figures": figures,
+        "figure_seconds": sum(figure["seconds"] for figure in figures.values()),
+        "figure_payload_bytes": sum(figure["payload_bytes"] for figure in figures.values()),
+        "max_rss_bytes": metrics.rss_bytes() if sys.platform == "darwin"
+        else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def run(sizes, engine="exact", file_format="parquet", k=3, seed=0,
+        render_mode=rendering.MODE_AUTO, progress=None, exact_max_rows=EXACT_MAX_ROWS) -> dict:
+    """Menjalankan benchmark untuk setiap ukuran, masing-masing di proses baru."""
+    results = {}
+    for n in sizes:
+        if progress is not None:
+            progress(n)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results[str(n)] = pool.submit(
+                run_size, n, engine, file_format, k, seed, render_mode, exact_max_rows=exact_max_rows
+            ).result()
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {"numpy": np.__version__, "pandas": pd.__version__},
+        "engine": engine,
+        "exact_max_rows": exact_max_rows,
+        "format": file_format,
+        "k": k,
+        "seed": seed,
+        "render_mode": render_mode,
+        "results": results,
+    }
+
+
+def _metrics(size_result):
+    # (bagian, nama, metrik, nilai) untuk semua angka yang dibandingkan dengan baseline
+    for section in ("stages", "figures"):
+        for name, measured in size_result.get(section, {}).items():
+            for metric in ("seconds", "peak_rss_bytes", "payload_bytes"):
+                if metric in measured:
+                    yield section, name, metric, measured[metric]
+
+
+_MIN_DELTA = {"seconds": MIN_SECONDS_DELTA, "peak_rss_bytes": MIN_RSS_DELTA, "payload_bytes": MIN_PAYLOAD_DELTA}
+
+
+def compare(current: dict, baseline: dict, tolerance=DEFAULT_TOLERANCE) -> list:
+    """Daftar regresi: metrik yang naik lebih dari `tolerance` (relatif) dan batas derau.
+
+    Hanya ukuran dan tahap yang ada di kedua hasil, dengan engine yang sama, yang dibandingkan.
+    """
+    regressions = []
+    for size, size_result in current["results"].items():
+        base_result = baseline.get("results", {}).get(size)
+        if base_result is None:
+            continue
+        if base_result.get("engine", baseline.get("engine")) != size_result.get("engine", current.get("engine")):
+            continue
+        base = {(section, name, metric): value for section, name, metric, value in _metrics(base_result)}
+        for section, name, metric, value in _metrics(size_result):
+            old = base.get((section, name, metric))
+            if old is None:
+                continue
+            if value > old * (1 + tolerance) and value - old > _MIN_DELTA[metric]:
+                regressions.append({
+                    "rows": int(size), "section": section, "name": name, "metric": metric,
+                    "baseline": old, "current": value, "ratio": value / old if old else float("inf"),
+                })
+    return regressions
+
+
+def _format_value(metric, value):
+    if metric == "seconds":
+        return f"{value:.3f} s"
+    return f"{value / 1024 ** 2:.1f} MB" if metric == "peak_rss_bytes" else f"{value / 1024:.1f} KB"
+
+
+def print_report(result: dict) -> None:
+    for size, size_result in result["results"].items():
+        print(f"\n{int(size):,} baris ({size_result['rows_after_preprocessing']:,} setelah preprocessing), "
+              f"engine {size_result.get('engine', result['engine'])}, format {result['format']}")
+        if size_result.get("note"):
+            print(f"  catatan: {size_result['note']}")
+        for name, measured in size_result["stages"].items():
+            if "skipped" in measured:
+                print(f"  {name:<16} dilewati ({measured['skipped']})")
+                continue
+            extra = f"  [{measured['method']}]" if "method" in measured else ""
+            print(f"  {name:<16} {measured['seconds']:9.3f} s  puncak RSS "
+                  f"{measured['peak_rss_bytes'] / 1024 ** 2:8.1f} MB{extra}")
+        print(f"  {'grafik':<16} {size_result['figure_seconds']:9.3f} s  payload "
+              f"{size_result['figure_payload_bytes'] / 1024:8.1f} KB ({len(size_result['figures'])} grafik)")
+        slowest = sorted(size_result["figures"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+        for title, measured in slowest[:5]:
+            print(f"    {measured['seconds']:9.3f} s  {measured['payload_bytes'] / 1024:8.1f} KB  {title}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tahap analisis dengan data sintetis.")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="jumlah baris, misalnya 10k 100k 1m 10m (default: semua)")
+    parser.add_argument("--engine", choices=pipeline.ENGINES, default="exact", help="metode clustering")
+    parser.add_argument("--format", choices=FORMATS, default="parquet", dest="file_format",
+                        help="format file untuk tahap ingest (default: parquet)")
+    parser.add_argument("-k", "--k", type=int, default=3, help="jumlah cluster untuk tahap K-Means")
+    parser.add_argument("--seed", type=int, default=0, help="seed generator data sintetis")
+    parser.add_argument("--render-mode", choices=(rendering.MODE_AUTO, rendering.MODE_HEATMAP, rendering.MODE_FULL),
+                        default=rendering.MODE_AUTO, help="mode render grafik per titik")
+    parser.add_argument("--exact-max-rows", type=parse_size, default=EXACT_MAX_ROWS,
+                        help="di atas jumlah baris ini engine exact diganti minibatch (default: 2m)")
+    parser.add_argument("-o", "--output", help="tulis hasil sebagai baseline JSON ke file ini")
+    parser.add_argument("--compare", help="baseline JSON pembanding; exit 1 jika ada regresi")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="kenaikan relatif yang masih diterima (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes]
+    result = run(sizes, args.engine, args.file_format, args.k, args.seed, args.render_mode,
+                 progress=lambda n: print(f"Mengukur {n:,} baris...", file=sys.stderr),
+                 exact_max_rows=args.exact_max_rows)
+    print_report(result)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2, ensure_ascii=False))
+        print(f"\nBaseline ditulis ke {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if (baseline.get("engine"), baseline.get("format")) != (args.engine, args.file_format):
+            print(f"Peringatan: baseline memakai engine {baseline.get('engine')} dan format "
+                  f"{baseline.get('format')}", file=sys.stderr)
+        regressions = compare(result, baseline, args.tolerance)
+        for item in regressions:
+            print(f"REGRESI {item['rows']:,} baris, {item['name']} ({item['metric']}): "
+                  f"{_format_value(item['metric'], item['baseline'])} → "
+                  f"{_format_value(item['metric'], item['current'])} (x{item['ratio']:.2f})")
+        print(f"{len(regressions)} regresi dibanding {args.compare} (toleransi {args.tolerance:.0%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
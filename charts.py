@@ -0,0 +1,286 @@
+from typing import NamedTuple
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+import aggregates
+import rendering
+import skills
+
+
+class ChartContext(NamedTuple):
+    """Data yang dibutuhkan pembuat grafik untuk satu dataset hasil clustering."""
+
+    df: pd.DataFrame
+    cube: aggregates.AggregateCube
+    skill_table: skills.SkillTable
+    render_mode: str = rendering.MODE_AUTO
+    point_threshold: int = rendering.POINT_THRESHOLD
+
+
+def chart_context(df, render_mode=rendering.MODE_AUTO, point_threshold=rendering.POINT_THRESHOLD):
+    """Membangun agregat dan tabel keterampilan untuk `df` sekaligus."""
+    return ChartContext(
+        df,
+        aggregates.AggregateCube(df),
+        skills.SkillTable(df["Required_Skills"]),
+        render_mode,
+        point_threshold,
+    )
+
+
+# Setiap pembuat grafik mengembalikan (grafik, keterangan). Grafik berupa figure Plotly,
+# kecuali word cloud yang berupa gambar PNG (bytes). Keterangan boleh None.
+
+def salary_by_job_title(ctx):
+    salary_bins = ctx.cube.histogram()
+    fig = px.bar(
+        salary_bins,
+        x='Bin',
+        y='Count',
+        color='Job_Title',
+        title="Distribusi Gaji berdasarkan Jabatan Pekerjaan",
+        barmode='overlay',
+        opacity=0.6,
+        labels={'Bin': 'Salary_USD', 'Count': 'count'}
+    )
+    fig.update_traces(width=salary_bins.attrs.get("bin_width"))
+    fig.update_layout(bargap=0)
+    return fig, f"Histogram dihitung di server dari seluruh {ctx.cube.rows:,} baris."
+
+
+def salary_by_industry(ctx):
+    industry_salary = ctx.cube.mean('Industry', 'Cluster')
+    industry_salary['Cluster'] = industry_salary['Cluster'].astype(str)
+    fig = px.bar(industry_salary, x='Industry', y='Salary_USD', color='Cluster', barmode='group',
+                 title="Perbandingan Gaji antar Industri")
+    return fig, None
+
+
+def risk_vs_salary(ctx):
+    return rendering.scatter(
+        ctx.df, 'Automation_Risk', 'Salary_USD', ctx.render_mode, ctx.point_threshold,
+        color='Cluster', title="Hubungan Risiko Otomatisasi dan Gaji"
+    )
+
+
+def company_size_vs_risk(ctx):
+    salary_size = ctx.df['Salary_USD'] + abs(ctx.df['Salary_USD'].min()) + 1
+    return rendering.scatter(
+        ctx.df.assign(Salary_Size=salary_size), 'Company_Size', 'Automation_Risk',
+        ctx.render_mode, ctx.point_threshold,
+        size='Salary_Size', color='Industry',
+        title="Hubungan antara Ukuran Perusahaan dan Risiko Otomatisasi",
+        hover_data=['Job_Title']
+    )
+
+
+def location_by_remote_and_industry(ctx):
+    fig = px.bar(
+        ctx.cube.counts('Location', 'Industry', 'Remote_Friendly'), x='Location', y='Count', color='Industry',
+        barmode='stack', facet_col='Remote_Friendly',
+        title="Distribusi Lokasi Kerja Berdasarkan Remote Friendly dan Industri"
+    )
+    return fig, None
+
+
+def remote_share(ctx):
+    fig = px.pie(ctx.cube.counts('Remote_Friendly'), names='Remote_Friendly', values='Count',
+                 title="Persentase Pekerjaan yang Mendukung Kerja Jarak Jauh")
+    return fig, None
+
+
+def salary_by_company_size(ctx):
+    box_stats = ctx.cube.box_stats()
+    fig = go.Figure(go.Box(
+        x=box_stats['Company_Size'].astype(str),
+        q1=box_stats['q1'],
+        median=box_stats['median'],
+        q3=box_stats['q3'],
+        lowerfence=box_stats['lowerfence'],
+        upperfence=box_stats['upperfence'],
+    ))
+    fig.update_layout(title="Distribusi Gaji berdasarkan Ukuran Perusahaan",
+                      xaxis_title='Company_Size', yaxis_title='Salary_USD')
+    return fig, None
+
+
+def growth_by_ai_adoption(ctx):
+    fig = px.bar(ctx.cube.counts('AI_Adoption_Level', 'Job_Growth_Projection', 'Industry'),
+                 x='AI_Adoption_Level', y='Count', color='Industry', facet_col='Job_Growth_Projection',
+                 title="Hubungan Proyeksi Pertumbuhan dengan Tingkat Adopsi AI")
+    return fig, None
+
+
+def skill_wordcloud(ctx):
+    return ctx.skill_table.wordcloud_png(), None
+
+
+def salary_by_location(ctx):
+    fig = px.bar(
+        ctx.cube.mean('Location'),
+        x='Location',
+        y='Salary_USD',
+        title="Distribusi Gaji Berdasarkan Lokasi",
+        labels={'Salary_USD': 'avg of Salary_USD'}
+    )
+    return fig, None
+
+
+def salary_by_ai_adoption(ctx):
+    avg_salary = ctx.cube.mean('AI_Adoption_Level')
+    fig = px.bar(avg_salary, x='AI_Adoption_Level', y='Salary_USD', title="Rata-rata Gaji untuk Setiap Tingkat Adopsi AI")
+    return fig, None
+
+
+def risk_by_location(ctx):
+    fig = px.bar(ctx.cube.mean_risk('Location', 'Industry'), x='Location', y='Automation_Risk',
+                 color='Industry', barmode='group',
+                 labels={'Automation_Risk': 'Rata-rata Risiko Otomatisasi (1=Low, 3=High)'},
+                 title="Perbandingan Risiko Otomatisasi di Berbagai Lokasi")
+    return fig, None
+
+
+def growth_by_industry(ctx):
+    fig = px.bar(ctx.cube.counts('Industry', 'Job_Growth_Projection'), x='Industry', y='Count',
+                 color='Job_Growth_Projection',
+                 title="Proyeksi Pertumbuhan Pekerjaan Berdasarkan Industri")
+    return fig, None
+
+
+def remote_frequency(ctx):
+    remote_counts = ctx.cube.counts('Remote_Friendly').sort_values('Count', ascending=False)
+
+    fig = px.bar(
+        remote_counts,
+        x='Remote_Friendly',
+        y='Count',
+        color='Remote_Friendly',
+        title="Frekuensi Lokasi Kerja berdasarkan Remote Friendly",
+        text='Count',
+        color_discrete_sequence=["#636EFA", "#EF553B", "#00CC96"]
+    )
+
+    fig.update_layout(
+        xaxis_title="Tipe Lokasi Kerja",
+        yaxis_title="Jumlah Frekuensi",
+        font=dict(size=14),
+        title_font=dict(size=18),
+        legend_title="Remote Friendly",
+    )
+
+    fig.update_traces(
+        texttemplate='%{text}',
+        textposition='outside',
+        marker=dict(line=dict(width=2, color='DarkSlateGrey'))
+    )
+    return fig, None
+
+
+def jobs_by_company_size(ctx):
+    fig = px.pie(ctx.cube.counts('Company_Size'), names='Company_Size', values='Count',
+                 title="Distribusi Pekerjaan Berdasarkan Ukuran Perusahaan")
+    return fig, None
+
+
+def salary_vs_skill_count(ctx):
+    return rendering.scatter(
+        ctx.df.assign(Skill_Count=ctx.skill_table.counts), 'Skill_Count', 'Salary_USD',
+        ctx.render_mode, ctx.point_threshold,
+        color='Industry',
+        title="Hubungan Gaji dengan Jumlah Keterampilan yang Dibutuhkan",
+        hover_data=['Job_Title']
+    )
+
+
+def job_titles_by_industry(ctx):
+    fig = px.bar(ctx.cube.counts('Industry', 'Job_Title'), x='Industry', y='Count', color='Industry',
+                 text='Job_Title', barmode='stack',
+                 title="Distribusi Jabatan Berdasarkan Industri")
+    return fig, None
+
+
+def salary_risk_correlation(ctx):
+    fig = px.imshow(ctx.cube.risk_correlation(), text_auto=True, title="Korelasi antara Gaji dan Risiko Otomatisasi")
+    return fig, None
+
+
+def remote_job_titles(ctx):
+    remote_jobs = ctx.cube.counts('Remote_Friendly', 'Job_Title')
+    remote_jobs = remote_jobs[remote_jobs['Remote_Friendly'] == 'Yes'][['Job_Title', 'Count']]
+    remote_jobs = remote_jobs.sort_values('Count', ascending=False)
+    fig = px.bar(remote_jobs, x='Job_Title', y='Count', title="Frekuensi Jabatan yang Mendukung Kerja Remote")
+    return fig, None
+
+
+def salary_by_growth(ctx):
+    return rendering.violin(
+        ctx.df, 'Job_Growth_Projection', 'Salary_USD', ctx.render_mode, ctx.point_threshold,
+        color='Cluster', title="Distribusi Gaji berdasarkan Proyeksi Pertumbuhan Pekerjaan"
+    )
+
+
+def job_title_frequency(ctx):
+    pivot_data = ctx.cube.counts('Industry', 'Job_Title').pivot_table(
+        index='Industry',
+        columns='Job_Title',
+        values='Count',
+        aggfunc='sum',
+        fill_value=0,
+        observed=True
+    )
+
+    fig = px.imshow(
+        pivot_data,
+        color_continuous_scale='Viridis',
+        labels=dict(x="Job Title", y="Industry", color="Frequency"),
+        title="Frekuensi Jabatan Berdasarkan Industri"
+    )
+    return fig, None
+
+
+# Urutan grafik sama dengan pilihan pada halaman Analisis Data
+CHARTS = {
+    "Distribusi Gaji berdasarkan Jabatan Pekerjaan": salary_by_job_title,
+    "Perbandingan Gaji antar Industri": salary_by_industry,
+    "Hubungan antara Risiko Otomatisasi dan Gaji": risk_vs_salary,
+    "Hubungan antara Ukuran Perusahaan dan Risiko Otomatisasi": company_size_vs_risk,
+    "Distribusi Lokasi Kerja Berdasarkan Remote Friendly dan Industri": location_by_remote_and_industry,
+    "Persentase Pekerjaan yang Mendukung Kerja Jarak Jauh": remote_share,
+    "Distribusi Gaji berdasarkan Ukuran Perusahaan": salary_by_company_size,
+    "Hubungan Proyeksi Pertumbuhan dengan Tingkat Adopsi AI": growth_by_ai_adoption,
+    "Keterampilan yang Paling Banyak Dibutuhkan": skill_wordcloud,
+    "Distribusi Gaji Berdasarkan Lokasi": salary_by_location,
+    "Rata-rata Gaji untuk Setiap Tingkat Adopsi AI": salary_by_ai_adoption,
+    "Perbandingan Risiko Otomatisasi di Berbagai Lokasi": risk_by_location,
+    "Proyeksi Pertumbuhan Pekerjaan Berdasarkan Industri": growth_by_industry,
+    "Frekuensi Lokasi Kerja berdasarkan Remote Friendly": remote_frequency,
+    "Distribusi Pekerjaan Berdasarkan Ukuran Perusahaan": jobs_by_company_size,
+    "Hubungan Gaji dengan Jumlah Keterampilan yang Dibutuhkan": salary_vs_skill_count,
+    "Distribusi Jabatan Berdasarkan Industri": job_titles_by_industry,
+    "Korelasi antara Gaji dan Risiko Otomatisasi": salary_risk_correlation,
+    "Frekuensi Jabatan yang Mendukung Kerja Remote": remote_job_titles,
+    "Distribusi Gaji berdasarkan Proyeksi Pertumbuhan Pekerjaan": salary_by_growth,
+    "Frekuensi Jabatan Berdasarkan Industri": job_title_frequency,
+}
+
+
+def build(title: str, ctx: ChartContext):
+    return CHARTS[title](ctx)
+
+
+def pca_figure(df, render_mode=rendering.MODE_AUTO, point_threshold=rendering.POINT_THRESHOLD):
+    return rendering.scatter(
+        df, 'PCA1', 'Salary_USD', render_mode, point_threshold,
+        color='Cluster', title="Visualisasi PCA (1 Komponen)"
+    )
+
+
+def elbow_figure(k_values, wcss_values):
+    return px.line(
+        x=list(k_values),
+        y=list(wcss_values),
+        title="Elbow Method",
+        labels={"x": "Jumlah Cluster", "y": "WCSS (Inertia)"}
+    )
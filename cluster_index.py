@@ -0,0 +1,130 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+# Kolom yang diindeks: indeks utama per cluster, indeks sekunder per industri dan lokasi
+INDEX_COLUMNS = ("Cluster", "Industry", "Location")
+
+
+def _group_positions(series: pd.Series):
+    # Posisi baris dikelompokkan per nilai (tiap array terurut naik), beserta kode nilai per baris
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        values = series.cat.categories
+    else:
+        codes, values = pd.factorize(series, sort=True)
+
+    dtype = np.int32 if len(series) < np.iinfo(np.int32).max else np.int64
+    valid = codes >= 0
+    order = np.flatnonzero(valid)[np.argsort(codes[valid], kind="stable")].astype(dtype)
+    counts = np.bincount(codes[valid], minlength=len(values))
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    return {value: rows for value, rows in zip(values, groups) if rows.size}, codes, values
+
+
+class ClusterIndex:
+    """Indeks posisi baris per cluster, industri dan lokasi untuk satu hasil clustering.
+
+    Pencarian dan statistik per cluster dijawab dari indeks ini tanpa memindai ulang
+    frame; biaya sebuah query sebanding dengan jumlah baris yang cocok.
+    """
+
+    def __init__(self, df: pd.DataFrame, value="Salary_USD"):
+        self.rows_total = len(df)
+        self._groups = {}
+        self._codes = {}
+        for column in INDEX_COLUMNS:
+            groups, codes, values = _group_positions(df[column])
+            self._groups[column] = groups
+            self._codes[column] = (codes, values)
+        self.cluster_stats = self._cluster_stats(df[value].to_numpy(dtype=np.float64), value)
+
+    def appended(self, batch: pd.DataFrame, scale=1.0, shift=0.0, value="Salary_USD") -> "ClusterIndex":
+        """Indeks baru dengan baris `batch` di belakang baris lama, tanpa mengurutkan ulang data lama.
+
+        Statistik gaji cluster lama dipetakan menjadi `scale * nilai + shift` (scale > 0)
+        lalu digabung dengan statistik batch.
+        """
+        batch_index = ClusterIndex(batch, value)
+        offset = self.rows_total
+        index = copy.copy(self)
+        index.rows_total = offset + batch_index.rows_total
+        index._groups = {}
+        index._codes = {}
+        for column in INDEX_COLUMNS:
+            old_codes, old_values = self._codes[column]
+            codes, values = batch_index._codes[column]
+            # Nilai lama tetap di kodenya; nilai baru ditambahkan di belakang
+            merged_values = pd.Index(old_values).append(pd.Index(values).difference(old_values, sort=False))
+            codes = np.where(codes >= 0, merged_values.get_indexer(values)[codes], -1)
+            index._codes[column] = (np.concatenate([old_codes, codes]), merged_values)
+
+            old_groups, groups = self._groups[column], batch_index._groups[column]
+            index._groups[column] = {}
+            for item in merged_values:
+                parts = [old_groups[item]] if item in old_groups else []
+                if item in groups:
+                    parts.append(groups[item] + offset)
+                if parts:
+                    index._groups[column][item] = np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+        old_stats = self.cluster_stats.assign(**{
+            f"Rata-rata {value}": scale * self.cluster_stats[f"Rata-rata {value}"] + shift,
+            f"Min {value}": scale * self.cluster_stats[f"Min {value}"] + shift,
+            f"Max {value}": scale * self.cluster_stats[f"Max {value}"] + shift,
+        })
+        stats = pd.concat([old_stats, batch_index.cluster_stats])
+        stats = stats.assign(Total=stats["Jumlah"] * stats[f"Rata-rata {value}"]).groupby(level=0)
+        merged = stats.agg({"Jumlah": "sum", "Total": "sum", f"Min {value}": "min", f"Max {value}": "max"})
+        merged.insert(1, f"Rata-rata {value}", merged.pop("Total") / merged["Jumlah"])
+        merged["Industri Terbanyak"] = [index._most_common("Industry", index._groups["Cluster"][c]) for c in merged.index]
+        merged["Lokasi Terbanyak"] = [index._most_common("Location", index._groups["Cluster"][c]) for c in merged.index]
+        index.cluster_stats = merged.rename_axis("Cluster")
+        return index
+
+    def values(self, column: str) -> list:
+        return list(self._groups[column])
+
+    def rows(self, **criteria) -> np.ndarray:
+        """Posisi baris yang cocok dengan semua kriteria, misalnya rows(Cluster=[0], Industry=["Tech"]).
+
+        Kriteria kosong atau None diabaikan.
+        """
+        selections = []
+        for column, wanted in criteria.items():
+            if wanted is None or (not np.isscalar(wanted) and len(wanted) == 0):
+                continue
+            wanted = [wanted] if np.isscalar(wanted) else wanted
+            groups = self._groups[column]
+            parts = [groups[value] for value in wanted if value in groups]
+            selections.append(np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64))
+
+        if not selections:
+            return np.arange(self.rows_total)
+        selections.sort(key=len)
+        result = selections[0]
+        for other in selections[1:]:
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def _most_common(self, column, rows):
+        codes, values = self._codes[column]
+        codes = codes[rows]
+        codes = codes[codes >= 0]
+        return values[np.bincount(codes).argmax()] if codes.size else None
+
+    def _cluster_stats(self, values, value):
+        records = []
+        for cluster, rows in self._groups["Cluster"].items():
+            cluster_values = values[rows]
+            records.append({
+                "Cluster": cluster,
+                "Jumlah": rows.size,
+                f"Rata-rata {value}": cluster_values.mean(),
+                f"Min {value}": cluster_values.min(),
+                f"Max {value}": cluster_values.max(),
+                "Industri Terbanyak": self._most_common("Industry", rows),
+                "Lokasi Terbanyak": self._most_common("Location", rows),
+            })
+        return pd.DataFrame(records).set_index("Cluster")
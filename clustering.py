@@ -0,0 +1,393 @@
+import hashlib
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+import numpy as np
+
+import metrics
+
+# Jumlah hasil sweep elbow yang disimpan di memori proses
+SWEEP_CACHE_SIZE = 8
+_sweep_cache = OrderedDict()
+_sweep_cache_lock = threading.Lock()
+
+# Ukuran batch dan jumlah epoch MiniBatchKMeans pada clustering multi-fitur
+MINIBATCH_SIZE = 4096
+MINIBATCH_EPOCHS = 3
+
+# Di atas jumlah baris ini silhouette multi-fitur diestimasi dari sampel
+SILHOUETTE_SAMPLE_SIZE = 10_000
+
+
+def _as_1d(X) -> np.ndarray:
+    x = np.asarray(X, dtype=np.float64)
+    if x.ndim == 2:
+        if x.shape[1] != 1:
+            raise ValueError("KMeans1D hanya mendukung satu fitur")
+        x = x[:, 0]
+    return x
+
+
+def _segment_cost(prefix, prefix_sq, start, end):
+    # SSE dari x[start..end] (inklusif) berdasarkan prefix sum
+    count = end - start + 1
+    total = prefix[end + 1] - prefix[start]
+    return prefix_sq[end + 1] - prefix_sq[start] - total * total / count
+
+
+def _ckmeans_dp(x_sorted: np.ndarray, k_max: int):
+    """Program dinamis Ckmeans.1d.dp untuk data yang sudah terurut.
+
+    Mengembalikan (wcss, split), dengan wcss[q] adalah WCSS optimal untuk q+1 cluster
+    dan split[q, i] adalah indeks awal cluster ke-q pada solusi optimal untuk x[:i+1].
+    Setiap lapisan diselesaikan dengan divide & conquer (indeks split optimal monoton),
+    dan setiap tingkat rekursi dievaluasi sekaligus dengan numpy.
+    """
+    n = x_sorted.shape[0]
+    centered = x_sorted - x_sorted.mean()
+    prefix = np.concatenate(([0.0], np.cumsum(centered)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+    positions = np.arange(n)
+    previous = _segment_cost(prefix, prefix_sq, np.zeros(n, dtype=np.int64), positions)
+    split = np.zeros((k_max, n), dtype=np.int64)
+    wcss = np.empty(k_max)
+    wcss[0] = previous[-1]
+
+    for q in range(1, k_max):
+        # base[j] = D[q-1][j-1] - prefix_sq[j], sehingga tiap kandidat cukup dua gather
+        base = np.full(n, np.inf)
+        base[1:] = previous[:-1] - prefix_sq[1:n]
+        current = np.full(n, np.inf)
+        i_lo = np.array([q])
+        i_hi = np.array([n - 1])
+        j_lo = np.array([q])
+        j_hi = np.array([n - 1])
+
+        while i_lo.size:
+            mid = (i_lo + i_hi) // 2
+            # Awal cluster terakhir tidak pernah mundur saat jumlah cluster bertambah
+            stop = np.minimum(j_hi, mid)
+            start = np.minimum(np.maximum(j_lo, split[q - 1, mid]), stop) if q > 1 else j_lo
+            counts = stop - start + 1
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            j = np.arange(offsets[-1] + counts[-1]) - np.repeat(offsets - start, counts)
+            total = np.repeat(prefix[mid + 1], counts) - prefix[j]
+            size = np.repeat(mid + 1, counts) - j
+            values = base[j] + np.repeat(prefix_sq[mid + 1], counts) - total * total / size
+
+            # Kandidat terbaik per segmen: posisi pertama yang sama dengan minimum segmen
+            minimum = np.minimum.reduceat(values, offsets)
+            hits = np.flatnonzero(values <= np.repeat(minimum, counts))
+            segment = np.searchsorted(offsets, hits, side="right")
+            first = np.concatenate(([True], segment[1:] != segment[:-1]))
+            best_j = j[hits[first]]
+            current[mid] = minimum
+            split[q, mid] = best_j
+
+            left = i_lo <= mid - 1
+            right = mid + 1 <= i_hi
+            i_lo, i_hi, j_lo, j_hi = (
+                np.concatenate((i_lo[left], mid[right] + 1)),
+                np.concatenate((mid[left] - 1, i_hi[right])),
+                np.concatenate((j_lo[left], best_j[right])),
+                np.concatenate((best_j[left], j_hi[right])),
+            )
+
+        previous = current
+        wcss[q] = previous[-1]
+
+    return np.maximum(wcss, 0.0), split
+
+
+def wcss_1d(X, k_values) -> list:
+    """WCSS optimal untuk setiap k pada `k_values` dari satu kali pengurutan data."""
+    k_values = list(k_values)
+    x_sorted = np.sort(_as_1d(X))
+    wcss, _ = _ckmeans_dp(x_sorted, min(max(k_values), x_sorted.size))
+    return [float(wcss[k - 1]) if k <= wcss.size else 0.0 for k in k_values]
+
+
+class KMeans1D:
+    """K-Means eksak untuk satu fitur (pendekatan Ckmeans.1d.dp), O(k n log n).
+
+    Antarmukanya mengikuti sklearn.cluster.KMeans: `labels_`, `cluster_centers_`
+    dan `inertia_`. Hasilnya deterministik; label diurutkan dari nilai terkecil.
+    """
+
+    def __init__(self, n_clusters=8):
+        self.n_clusters = n_clusters
+
+    def fit(self, X, y=None):
+        x = _as_1d(X)
+        if x.size < self.n_clusters:
+            raise ValueError(
+                f"n_samples={x.size} harus >= n_clusters={self.n_clusters}."
+            )
+
+        order = np.argsort(x, kind="stable")
+        x_sorted = x[order]
+        wcss, split = _ckmeans_dp(x_sorted, self.n_clusters)
+        return self._set_solution(x_sorted, order, wcss, split)
+
+    def _set_solution(self, x_sorted, order, wcss, split):
+        # Tabel split dari DP dengan k_max >= n_clusters juga memuat solusi untuk k ini
+        sorted_labels = np.empty(x_sorted.size, dtype=np.int32)
+        centers = np.empty(self.n_clusters)
+        end = x_sorted.size - 1
+        for q in range(self.n_clusters - 1, -1, -1):
+            start = split[q, end]
+            sorted_labels[start:end + 1] = q
+            centers[q] = x_sorted[start:end + 1].mean()
+            end = start - 1
+
+        self.labels_ = np.empty(x_sorted.size, dtype=np.int32)
+        self.labels_[order] = sorted_labels
+        self.cluster_centers_ = centers.reshape(-1, 1)
+        self.inertia_ = float(wcss[self.n_clusters - 1])
+        return self
+
+    def fit_predict(self, X, y=None):
+        return self.fit(X).labels_
+
+    def predict(self, X):
+        # Batas keputusan berada di titik tengah antar centroid yang terurut
+        centers = self.cluster_centers_[:, 0]
+        bounds = (centers[1:] + centers[:-1]) / 2
+        return np.searchsorted(bounds, _as_1d(X)).astype(np.int32)
+
+
+def array_hash(X) -> str:
+    """Hash isi array, dipakai sebagai kunci memo hasil clustering."""
+    X = np.ascontiguousarray(X)
+    digest = hashlib.sha256(X.tobytes())
+    digest.update(str((X.shape, X.dtype.str)).encode())
+    return digest.hexdigest()
+
+
+def _fit_sklearn(X, k, threads=None):
+    from sklearn.cluster import KMeans
+    from threadpoolctl import threadpool_limits
+
+    # Tanpa batas, KMeans memakai thread OpenMP sebanyak CPU di setiap proses
+    with threadpool_limits(limits=threads):
+        return KMeans(n_clusters=k, random_state=42).fit(X)
+
+
+def fit_minibatch(X, k, batch_size=MINIBATCH_SIZE, epochs=MINIBATCH_EPOCHS, random_state=42):
+    """Melatih MiniBatchKMeans dengan partial_fit per batch sehingga memori tetap terbatas.
+
+    `labels_` dan `inertia_` dihitung ulang untuk seluruh data, per batch.
+    """
+    from sklearn.cluster import MiniBatchKMeans
+
+    n = X.shape[0]
+    batch_size = max(batch_size, 3 * k)
+    model = MiniBatchKMeans(n_clusters=k, batch_size=batch_size, n_init=3, random_state=random_state)
+    rng = np.random.default_rng(random_state)
+    for _ in range(epochs):
+        order = rng.permutation(n)
+        for start in range(0, n, batch_size):
+            batch = X[np.sort(order[start:start + batch_size])]
+            if batch.shape[0] >= k:
+                model.partial_fit(batch)
+
+    labels = np.empty(n, dtype=np.int32)
+    inertia = 0.0
+    for start in range(0, n, batch_size):
+        batch = X[start:start + batch_size]
+        labels[start:start + batch_size] = model.predict(batch)
+        inertia -= model.score(batch)
+    model.labels_ = labels
+    model.inertia_ = inertia
+    return model
+
+
+def _sweep_exact(X, k_values):
+    x = _as_1d(X)
+    if x.size < max(k_values):
+        raise ValueError(f"n_samples={x.size} harus >= n_clusters={max(k_values)}.")
+    order = np.argsort(x, kind="stable")
+    x_sorted = x[order]
+    wcss, split = _ckmeans_dp(x_sorted, max(k_values))
+    return {k: KMeans1D(n_clusters=k)._set_solution(x_sorted, order, wcss, split) for k in k_values}
+
+
+def _pool_context():
+    # Bukan fork: pemanggilnya bisa berupa server Streamlit dengan banyak thread. Server
+    # forkserver berumur panjang dan sudah memuat sklearn, jadi pool berikutnya cepat dibuat.
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["clustering", "sklearn.cluster"])
+    return context
+
+
+def _sweep_sklearn(X, k_values, max_workers, progress=None):
+    if max_workers == 1:
+        return _sweep_serial(lambda X, k: _fit_sklearn(X, k, threads=1), X, k_values, progress)
+    # Paralelisme ada di tingkat proses, jadi setiap proses cukup satu thread OpenMP
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context())
+    try:
+        futures = {pool.submit(_fit_sklearn, X, k, 1): k for k in k_values}
+        models = {}
+        for future in as_completed(futures):
+            models[futures[future]] = future.result()
+            if progress is not None:
+                progress(len(models), len(k_values))
+    except BaseException:
+        # Misalnya job dibatalkan: k yang belum mulai tidak perlu dilatih
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return {k: models[k] for k in k_values}
+
+
+def _sweep_serial(fit, X, k_values, progress=None):
+    models = {}
+    for k in k_values:
+        models[k] = fit(X, k)
+        if progress is not None:
+            progress(len(models), len(k_values))
+    return models
+
+
+def elbow_sweep(X, k_values=range(2, 11), engine="exact", max_workers=None, progress=None) -> dict:
+    """Model K-Means untuk setiap k pada `k_values`, dimemo per (hash data, engine, k).
+
+    Engine "exact" memakai satu DP untuk semua k; engine "sklearn" melatih tiap k
+    secara paralel di process pool; engine "minibatch" melatih tiap k dengan
+    partial_fit agar memori tetap terbatas. Model hasil memo dipakai bersama, jangan diubah.
+    `progress(selesai, total)` dipanggil setiap kali satu k selesai dilatih.
+    """
+    k_values = tuple(k_values)
+    key = (array_hash(X), engine, k_values)
+    with _sweep_cache_lock:
+        if key in _sweep_cache:
+            _sweep_cache.move_to_end(key)
+            metrics.count_cache("elbow_sweep", True)
+            return _sweep_cache[key]
+    metrics.count_cache("elbow_sweep", False)
+
+    if engine == "exact":
+        models = _sweep_exact(X, k_values)
+        if progress is not None:
+            progress(len(k_values), len(k_values))
+    elif engine == "sklearn":
+        models = _sweep_sklearn(X, k_values, max_workers, progress)
+    elif engine == "minibatch":
+        models = _sweep_serial(fit_minibatch, X, k_values, progress)
+    else:
+        raise ValueError(f"Engine clustering tidak dikenal: {engine}")
+
+    with _sweep_cache_lock:
+        _sweep_cache[key] = models
+        while len(_sweep_cache) > SWEEP_CACHE_SIZE:
+            _sweep_cache.popitem(last=False)
+    return models
+
+
+class SilhouetteResult(NamedTuple):
+    score: float
+    method: str
+    seconds: float
+    ci_low: float = None
+    ci_high: float = None
+    sample_size: int = None
+
+
+def _check_labels(labels, n):
+    n_labels = np.unique(labels).size
+    if not 2 <= n_labels <= n - 1:
+        raise ValueError(
+            f"Number of labels is {n_labels}. Valid values are 2 to n_samples - 1 (inclusive)"
+        )
+
+
+def silhouette_1d(X, labels) -> float:
+    """Silhouette eksak untuk satu fitur dalam O(k n log n) memakai prefix sum terurut."""
+    x = _as_1d(X)
+    labels = np.asarray(labels)
+    _check_labels(labels, x.size)
+
+    clusters, inverse = np.unique(labels, return_inverse=True)
+    sizes = np.bincount(inverse)
+    # distance[c, i] = jumlah |x_i - x_j| untuk semua j di cluster c
+    distance = np.empty((clusters.size, x.size))
+    for c in range(clusters.size):
+        members = np.sort(x[inverse == c])
+        prefix = np.concatenate(([0.0], np.cumsum(members)))
+        below = np.searchsorted(members, x)
+        distance[c] = (
+            x * below - prefix[below]
+            + (prefix[-1] - prefix[below]) - x * (sizes[c] - below)
+        )
+
+    own_size = sizes[inverse]
+    rows = np.arange(x.size)
+    a = distance[inverse, rows] / np.maximum(own_size - 1, 1)
+    distance /= sizes[:, None]
+    distance[inverse, rows] = np.inf
+    b = distance.min(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s = (b - a) / np.maximum(a, b)
+    # Konvensi sklearn: titik pada cluster berisi satu anggota bernilai 0
+    s[(own_size == 1) | ~np.isfinite(s)] = 0.0
+    return float(s.mean())
+
+
+def silhouette_sampled(X, labels, sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42):
+    """Estimasi silhouette dari sampel stratifikasi per cluster beserta interval kepercayaan 95%."""
+    from sklearn.metrics import silhouette_samples
+
+    X = np.asarray(X)
+    labels = np.asarray(labels)
+    _check_labels(labels, labels.size)
+    rng = np.random.default_rng(random_state)
+
+    clusters, inverse, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+    # Alokasi proporsional, minimal dua titik per cluster agar a(i) terdefinisi
+    allocation = np.minimum(sizes, np.maximum(2, np.round(sample_size * sizes / labels.size))).astype(int)
+    picked = np.concatenate([
+        rng.choice(np.flatnonzero(inverse == c), size=allocation[c], replace=False)
+        for c in range(clusters.size)
+    ])
+    values = silhouette_samples(X[picked], labels[picked])
+
+    # Estimator rata-rata terstratifikasi: bobot tiap strata = proporsi cluster di populasi
+    weights = sizes / labels.size
+    strata = inverse[picked]
+    means = np.bincount(strata, weights=values) / allocation
+    variances = np.array([
+        values[strata == c].var(ddof=1) if allocation[c] > 1 else 0.0
+        for c in range(clusters.size)
+    ])
+    finite = 1 - allocation / sizes
+    score = float((weights * means).sum())
+    stderr = float(np.sqrt((weights ** 2 * finite * variances / allocation).sum()))
+    return score, score - 1.96 * stderr, score + 1.96 * stderr, int(picked.size)
+
+
+def silhouette(X, labels, sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42) -> SilhouetteResult:
+    """Memilih cara menghitung silhouette sesuai bentuk data dan mencatat waktunya."""
+    from sklearn.metrics import silhouette_score
+
+    X = np.asarray(X)
+    started = time.perf_counter()
+    if X.ndim == 1 or X.shape[1] == 1:
+        score = silhouette_1d(X, labels)
+        return SilhouetteResult(score, "eksak 1-D", time.perf_counter() - started)
+
+    if X.shape[0] <= sample_size:
+        score = float(silhouette_score(X, labels))
+        return SilhouetteResult(score, "eksak", time.perf_counter() - started)
+
+    score, ci_low, ci_high, size = silhouette_sampled(X, labels, sample_size, random_state)
+    return SilhouetteResult(
+        score, "sampel terstratifikasi", time.perf_counter() - started, ci_low, ci_high, size
+    )
@@ -0,0 +1,266 @@
+import atexit
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+# Batas memori seluruh dataset bersama; di atasnya dataset yang paling lama tidak dipakai
+# dipindahkan ke disk
+STORE_MAX_BYTES = int(os.environ.get("TECHNO_STORE_MAX_BYTES", 1024 ** 3))
+
+# Batas ukuran file yang dipindahkan ke disk; di atasnya dataset tertua dibuang seluruhnya
+STORE_MAX_SPILL_BYTES = int(os.environ.get("TECHNO_STORE_MAX_SPILL_BYTES", 4 * 1024 ** 3))
+
+
+def _nbytes(value) -> int:
+    """Perkiraan memori sebuah nilai: frame, array, atau objek yang berisi keduanya."""
+    if isinstance(value, pd.DataFrame):
+        return schema.memory_usage(value)
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return _nbytes(vars(value))
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    def __init__(self, base):
+        self.base = base
+        self.overlays = {}
+        self.views = {}
+        self.spill_path = None
+        self.spill_overlays = {}
+        self.spill_bytes = 0
+        # Bertambah setiap kali overlay diganti, untuk cache yang bergantung pada isi frame
+        self.version = 0
+        # False jika frame pernah gagal ditulis ke Parquet; dataset itu tidak dipindahkan lagi
+        self.spillable = True
+
+    @property
+    def in_memory(self) -> bool:
+        return self.base is not None
+
+    def nbytes(self) -> int:
+        if not self.in_memory:
+            return 0
+        return _nbytes(self.base) + _nbytes(self.overlays) + _nbytes(self.views)
+
+
+class DatasetStore:
+    """Dataset bersama untuk semua sesi dalam satu proses server.
+
+    Setiap frame dasar (misalnya hasil upload atau preprocessing) disimpan sekali per
+    kunci isi dan tidak pernah diubah. Kolom turunan (misalnya Cluster dan PCA1) disimpan
+    sebagai overlay terpisah, dan objek turunan (agregat, indeks) sebagai view. Jika
+    total memori melebihi `max_bytes`, dataset yang paling lama tidak dipakai ditulis ke
+    Parquet lalu dilepas dari memori; view-nya dibangun ulang saat dibutuhkan lagi.
+    """
+
+    def __init__(self, max_bytes=STORE_MAX_BYTES, spill_dir=None, max_spill_bytes=STORE_MAX_SPILL_BYTES):
+        self.max_bytes = max_bytes
+        self.max_spill_bytes = max_spill_bytes
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._nbytes = {}
+        self._spill_numbers = itertools.count()
+        self.stats = {"hits": 0, "misses": 0, "spills": 0, "loads": 0, "drops": 0, "spill_errors": 0}
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, df: pd.DataFrame) -> pd.DataFrame:
+        """Menyimpan `df` sebagai frame dasar `key` (sekali saja) dan mengembalikan salinannya."""
+        with self._lock:
+            if key in self._entries:
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+                # Salinan dangkal: dengan copy-on-write, perubahan oleh pemanggil tidak ikut tersimpan
+                self._entries[key] = _Entry(df.copy(deep=False))
+                self._account(key)
+            return self.get(key)
+
+    def get(self, key) -> pd.DataFrame:
+        """Frame dasar `key`; KeyError jika dataset sudah dibuang dari penyimpanan."""
+        return self.frame(key)
+
+    def frame(self, key, *overlays) -> pd.DataFrame:
+        """Frame dasar `key` ditambah kolom dari overlay yang disebut."""
+        with self._lock:
+            entry = self._touch(key)
+            df = entry.base.copy(deep=False)
+            for name in overlays:
+                if name is not None:
+                    overlay = entry.overlays[name]
+                    df = df.assign(**{column: overlay[column] for column in overlay.columns})
+            return df
+
+    def add_overlay(self, key, name, columns: pd.DataFrame) -> None:
+        """Menyimpan kolom turunan `columns` (berindeks sama dengan frame dasar) sebagai overlay."""
+        with self._lock:
+            entry = self._touch(key)
+            if not columns.index.equals(entry.base.index):
+                raise ValueError("Indeks overlay harus sama dengan indeks frame dasar")
+            entry.overlays[name] = columns.copy(deep=False)
+            entry.version += 1
+            entry.views.pop(name, None)
+            self._discard_spill(entry, name)
+            self._account(key)
+
+    def version(self, key) -> int:
+        """Versi isi `key`: frame dasar tidak berubah, jadi hanya bertambah saat overlay diganti."""
+        with self._lock:
+            return self._entries[key].version
+
+    def view(self, key, name, build):
+        """Objek turunan `name` untuk `key`, dibangun dengan `build()` jika belum ada."""
+        with self._lock:
+            entry = self._touch(key)
+            if name in entry.views:
+                self.stats["hits"] += 1
+                return entry.views[name]
+        # Dibangun di luar kunci; jika dua sesi membangun bersamaan, hasil pertama dipakai
+        value = build()
+        with self._lock:
+            self.stats["misses"] += 1
+            entry = self._touch(key)
+            value = entry.views.setdefault(name, value)
+            self._account(key)
+            return value
+
+    def usage(self) -> dict:
+        """Ringkasan isi penyimpanan untuk pemantauan."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "in_memory": sum(entry.in_memory for entry in self._entries.values()),
+                "bytes": sum(self._nbytes.values()),
+                "max_bytes": self.max_bytes,
+                "spill_bytes": sum(entry.spill_bytes for entry in self._entries.values()),
+                **self.stats,
+            }
+
+    def _touch(self, key) -> _Entry:
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        if not entry.in_memory:
+            self._load(entry)
+            self._account(key)
+        return entry
+
+    def _account(self, key) -> None:
+        self._nbytes[key] = self._entries[key].nbytes()
+        total = sum(self._nbytes.values())
+        for victim in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            entry = self._entries[victim]
+            if victim == key or not entry.in_memory or not entry.spillable:
+                continue
+            nbytes = self._nbytes[victim]
+            if self._spill(victim):
+                total -= nbytes
+        self._limit_spill(keep=key)
+
+    def _spill_directory(self) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="techno-store-"))
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        return self._spill_dir
+
+    def _spill(self, key) -> bool:
+        """Memindahkan dataset `key` ke disk; False jika gagal dan dataset tetap di memori."""
+        entry = self._entries[key]
+        written = []
+        try:
+            directory = self._spill_directory()
+            if entry.spill_path is None:
+                path = directory / f"{key}.parquet"
+                written.append(path)
+                entry.base.to_parquet(path)
+                entry.spill_path = path
+            for name, overlay in entry.overlays.items():
+                if name not in entry.spill_overlays:
+                    path = directory / f"{key}.overlay{next(self._spill_numbers)}.parquet"
+                    written.append(path)
+                    overlay.to_parquet(path)
+                    entry.spill_overlays[name] = path
+        except Exception:
+            # Misalnya kolom object bertipe campuran dari XLSX yang tidak bisa ditulis ke
+            # Parquet (sama seperti cache di ingest.read_cached): dataset tetap di memori
+            for path in written:
+                path.unlink(missing_ok=True)
+            if entry.spill_path in written:
+                entry.spill_path = None
+            entry.spill_overlays = {
+                name: path for name, path in entry.spill_overlays.items() if path not in written
+            }
+            entry.spillable = False
+            self.stats["spill_errors"] += 1
+            return False
+        entry.spill_bytes = sum(
+            path.stat().st_size for path in [entry.spill_path, *entry.spill_overlays.values()]
+        )
+        entry.base = None
+        entry.overlays = {}
+        entry.views = {}
+        self._nbytes[key] = 0
+        self.stats["spills"] += 1
+        return True
+
+    def _load(self, entry) -> None:
+        # Kategori diselaraskan lagi dengan kamus bersama; kolom lain dibaca apa adanya
+        entry.base = schema.align_categories(pd.read_parquet(entry.spill_path))
+        entry.overlays = {name: pd.read_parquet(path) for name, path in entry.spill_overlays.items()}
+        self.stats["loads"] += 1
+
+    def _discard_spill(self, entry, name) -> None:
+        path = entry.spill_overlays.pop(name, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _limit_spill(self, keep) -> None:
+        total = sum(entry.spill_bytes for entry in self._entries.values())
+        for victim in list(self._entries):
+            if total <= self.max_spill_bytes:
+                break
+            entry = self._entries[victim]
+            if victim == keep or entry.in_memory or not entry.spill_bytes:
+                continue
+            total -= entry.spill_bytes
+            for path in [entry.spill_path, *entry.spill_overlays.values()]:
+                path.unlink(missing_ok=True)
+            del self._entries[victim]
+            del self._nbytes[victim]
+            self.stats["drops"] += 1
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def store() -> DatasetStore:
+    """Penyimpanan dataset bersama untuk seluruh proses server."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = DatasetStore()
+        return _store
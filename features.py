@@ -0,0 +1,113 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+
+import schema
+import skills
+
+# Kolom ordinal dan urutan tingkatnya
+ORDINAL_COLUMNS = ["Automation_Risk", "AI_Adoption_Level"]
+
+# Industry di-one-hot selama jumlah kategorinya tidak melebihi batas ini, selebihnya di-hash
+MAX_ONEHOT_CATEGORIES = 32
+HASH_BUCKETS = 16
+
+
+def _moments(values: np.ndarray):
+    mean = float(np.nanmean(values)) if values.size else 0.0
+    std = float(np.nanstd(values)) if values.size else 0.0
+    return mean, (std if std > 0 else 1.0)
+
+
+def _standardize(values: np.ndarray, mean: float, std: float) -> np.ndarray:
+    values = (values.astype(np.float32, copy=False) - mean) / std
+    # Nilai di luar tingkatan yang dikenal diperlakukan sebagai rata-rata
+    return np.nan_to_num(values, nan=0.0)
+
+
+def _industries(df: pd.DataFrame) -> list:
+    # Kosakata dari nilai yang muncul di dataset ini saja, bukan dari kamus kategori bersama
+    # yang ikut bertambah oleh upload sesi lain, agar lebar fitur hanya bergantung pada data
+    return sorted({str(value) for value in df["Industry"].dropna().unique()})
+
+
+def _industry_codes(df: pd.DataFrame, industries: list) -> np.ndarray:
+    # Indeks industri pada kosakata saat fit; industri yang tidak dikenal menjadi -1
+    series = df["Industry"]
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype("category")
+    # Dipetakan per kategori lalu per kode, tanpa membuat string per baris
+    lookup = pd.Index(industries).get_indexer(series.cat.categories.astype(str))
+    codes = series.cat.codes.to_numpy()
+    return np.where(codes >= 0, lookup[codes], -1)
+
+
+def _industry_columns(categories: list):
+    if len(categories) <= MAX_ONEHOT_CATEGORIES:
+        names = [f"Industry_{category}" for category in categories]
+        column_of = np.arange(len(categories))
+    else:
+        # Hash dihitung per kategori, bukan per baris
+        names = [f"Industry_hash_{i}" for i in range(HASH_BUCKETS)]
+        column_of = np.array([zlib.crc32(category.encode()) % HASH_BUCKETS for category in categories])
+    return names, column_of
+
+
+class FeatureEncoder:
+    """Matriks fitur untuk clustering yang bisa dipakai lagi untuk baris baru.
+
+    Fitur multi-fitur (float32): Salary_USD, Automation_Risk dan AI_Adoption_Level
+    (ordinal), Industry (one-hot atau hash) dan jumlah keterampilan dari Required_Skills.
+    Rata-rata dan simpangan baku dihitung saat `fit_transform`; `transform` memakai
+    statistik yang sama, sehingga batch baru berada di ruang fitur yang sama dengan
+    centroid. Dengan `multi_feature=False` hanya Salary_USD yang dipakai (StandardScaler).
+    """
+
+    def __init__(self, multi_feature=True):
+        self.multi_feature = multi_feature
+        self.names = None
+        self._stats = None
+        self._industries = None
+        self._industry_column = None
+
+    def fit_transform(self, df: pd.DataFrame) -> np.ndarray:
+        if not self.multi_feature:
+            from sklearn.preprocessing import StandardScaler
+
+            self.names = ["Salary_USD"]
+            self._stats = StandardScaler()
+            return self._stats.fit_transform(df[self.names])
+
+        columns, industry = self._raw_columns(df)
+        self._stats = [_moments(values) for values in columns]
+        return self._encode(columns, industry)
+
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        if not self.multi_feature:
+            return self._stats.transform(df[self.names])
+        return self._encode(*self._raw_columns(df))
+
+    def _raw_columns(self, df):
+        if self.names is None:
+            self._industries = _industries(df)
+            industry_names, self._industry_column = _industry_columns(self._industries)
+            self.names = ["Salary_USD", *ORDINAL_COLUMNS, "Skill_Count", *industry_names]
+        industry_codes = _industry_codes(df, self._industries)
+
+        columns = [df["Salary_USD"].to_numpy(dtype=np.float32)]
+        for column in ORDINAL_COLUMNS:
+            levels = {level: rank for rank, level in enumerate(schema.CATEGORY_ORDER[column])}
+            columns.append(df[column].map(levels).to_numpy(dtype=np.float32, na_value=np.nan))
+        columns.append(skills.skill_count(df["Required_Skills"]).astype(np.float32))
+        return columns, industry_codes
+
+    def _encode(self, columns, industry_codes):
+        X = np.zeros((len(columns[0]), len(self.names)), dtype=np.float32)
+        for i, (values, (mean, std)) in enumerate(zip(columns, self._stats)):
+            X[:, i] = _standardize(values, mean, std)
+
+        # Industri yang muncul setelah fit tidak punya kolom dan dibiarkan nol
+        rows = np.flatnonzero(industry_codes >= 0)
+        X[rows, len(columns) + self._industry_column[industry_codes[rows]]] = 1.0
+        return X
@@ -0,0 +1,133 @@
+"""Laporan waktu import per halaman untuk menjaga waktu start aplikasi.
+
+Setiap halaman diukur di interpreter baru (cold start) dengan `python -X importtime`:
+modul halaman induknya di-import dulu, lalu hanya tambahan waktu halaman itu yang dihitung.
+Modul halaman Home dibaca langsung dari import tingkat atas techno.py, sehingga import
+berat yang ditambahkan di sana langsung terlihat dan melanggar anggaran.
+
+    python import_report.py
+    python import_report.py --budget 1.5   # exit 1 jika halaman Home melebihi 1,5 detik
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+APP = Path(__file__).with_name("techno.py")
+
+# Anggaran waktu import halaman Home (cold start), dalam detik
+STARTUP_BUDGET_SECONDS = float(os.environ.get("TECHNO_STARTUP_BUDGET", 1.0))
+
+# Modul berat yang tidak boleh dimuat oleh halaman Home. Streamlit sendiri sudah memuat
+# plotly.graph_objects, jadi yang diawasi adalah plotly.express.
+HEAVY_MODULES = ("pandas", "sklearn", "plotly.express", "wordcloud", "matplotlib", "openpyxl", "pyarrow")
+
+# (halaman, halaman induk, modul yang dimuat saat halaman/cabang dibuka)
+PAGES = [
+    ("Analisis Data", "Home", [
+        "pandas", "aggregates", "cluster_index", "datastore", "incremental", "ingest", "jobs",
+        "metrics", "pipeline", "rendering", "schema", "skills", "table_view",
+    ]),
+    ("Upload XLSX", "Analisis Data", ["openpyxl"]),
+    ("Preprocessing", "Analisis Data", ["sklearn.preprocessing"]),
+    ("Clustering", "Preprocessing", ["sklearn.cluster", "sklearn.decomposition", "sklearn.metrics", "charts"]),
+    ("Visualisasi", "Analisis Data", ["charts"]),
+    ("Word Cloud", "Visualisasi", ["wordcloud"]),
+]
+
+_MARKER = "import-report-page-start"
+
+_PROBE = """
+import importlib, json, sys, time
+for name in {parents!r}:
+    importlib.import_module(name)
+sys.stderr.write({marker!r} + "\\n")
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+seconds = time.perf_counter() - start
+heavy = sorted(h for h in {heavy!r} if any(m == h or m.startswith(h + ".") for m in sys.modules))
+print(json.dumps({{"seconds": seconds, "heavy": heavy}}))
+"""
+
+
+def home_modules(app=APP) -> list:
+    """Modul yang di-import di tingkat atas skrip aplikasi (dimuat oleh setiap halaman)."""
+    modules = []
+    for node in ast.parse(Path(app).read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return modules
+
+
+def _page_modules():
+    modules = {"Home": ([], home_modules())}
+    for page, parent, page_modules in PAGES:
+        parent_parents, parent_modules = modules[parent]
+        modules[page] = (parent_parents + parent_modules, page_modules)
+    return modules
+
+
+def measure(parents, modules, top=5) -> dict:
+    """Waktu import `modules` setelah `parents` dimuat, di interpreter baru."""
+    probe = _PROBE.format(parents=parents, modules=modules, marker=_MARKER, heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, cwd=APP.parent, check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    # Baris importtime: "import time: <self us> | <kumulatif us> | <modul>"
+    heaviest = []
+    lines = completed.stderr.splitlines()
+    for line in lines[lines.index(_MARKER) + 1:] if _MARKER in lines else []:
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, _, name = line[len("import time:"):].split("|")
+            heaviest.append((name.strip(), int(self_us) / 1e6))
+    heaviest.sort(key=lambda item: item[1], reverse=True)
+    result["heaviest"] = heaviest[:top]
+    return result
+
+
+def report(budget=STARTUP_BUDGET_SECONDS) -> dict:
+    pages = {}
+    for page, (parents, modules) in _page_modules().items():
+        pages[page] = dict(measure(parents, modules), modules=modules)
+    home = pages["Home"]
+    return {
+        "budget_seconds": budget,
+        "within_budget": home["seconds"] <= budget and not home["heavy"],
+        "pages": pages,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Waktu import per halaman aplikasi.")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS,
+                        help="anggaran waktu import halaman Home dalam detik")
+    parser.add_argument("--json", action="store_true", help="cetak laporan sebagai JSON")
+    args = parser.parse_args(argv)
+
+    result = report(args.budget)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for page, page_result in result["pages"].items():
+            print(f"{page:<15} {page_result['seconds']:7.3f} s  ({', '.join(page_result['modules']) or '-'})")
+            for name, seconds in page_result["heaviest"]:
+                print(f"{'':<17}{seconds:7.3f} s  {name}")
+        home = result["pages"]["Home"]
+        if home["heavy"]:
+            print(f"Halaman Home memuat modul berat: {', '.join(home['heavy'])}")
+        status = "OK" if result["within_budget"] else "MELEBIHI ANGGARAN"
+        print(f"Home: {home['seconds']:.3f} s dari anggaran {args.budget:.3f} s - {status}")
+    return 0 if result["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Menambahkan batch baris baru ke hasil clustering tanpa mengulang preprocessing dan K-Means.
+
+Statistik standarisasi Salary_USD diperbarui secara berjalan, baris baru ditempatkan ke
+centroid terdekat di ruang fitur saat clustering (opsional sambil menggeser centroid), dan
+agregat untuk visualisasi diperbarui per delta.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+
+class IncrementalModel(NamedTuple):
+    """Centroid dan inertia setelah satu atau lebih batch tambahan.
+
+    Koordinat centroid tetap di ruang fitur saat clustering awal. `sums` adalah jumlah
+    vektor fitur anggota tiap cluster, dipakai untuk memperbarui inertia secara eksak.
+    """
+
+    n_clusters: int
+    cluster_centers_: np.ndarray
+    inertia_: float
+    counts: np.ndarray
+    sums: np.ndarray
+    batches: int = 0
+
+    @classmethod
+    def from_model(cls, model, X) -> "IncrementalModel":
+        """Ringkasan model K-Means beserta jumlah dan total fitur anggota tiap cluster."""
+        X = np.asarray(X, dtype=np.float64)
+        counts, sums = _cluster_sums(model.labels_, X, model.n_clusters)
+        centers = np.asarray(model.cluster_centers_, dtype=np.float64).reshape(-1, X.shape[1])
+        return cls(model.n_clusters, centers, float(model.inertia_), counts, sums)
+
+
+def update_moments(n, mean, var, values):
+    """Menggabungkan (jumlah, rata-rata, varians populasi) dengan `values` (Chan dkk.)."""
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return n, mean, var
+    total = n + values.size
+    delta = values.mean() - mean
+    m2 = var * n + values.var() * values.size + delta * delta * n * values.size / total
+    return total, mean + delta * values.size / total, m2 / total
+
+
+def _std(var):
+    # Sama seperti StandardScaler: varians nol tidak diskalakan
+    std = float(np.sqrt(var))
+    return std if std > 0 else 1.0
+
+
+def _cluster_sums(labels, X, k):
+    counts = np.bincount(labels, minlength=k).astype(np.float64)
+    sums = np.column_stack([np.bincount(labels, weights=X[:, j], minlength=k) for j in range(X.shape[1])])
+    return counts, sums
+
+
+def _membership(model, n_features):
+    if isinstance(model, IncrementalModel):
+        return model.counts, model.sums
+    # Tanpa matriks fitur: anggap centroid adalah rata-rata anggotanya (K-Means yang konvergen)
+    counts = np.bincount(model.labels_, minlength=model.n_clusters).astype(np.float64)
+    centers = np.asarray(model.cluster_centers_, dtype=np.float64).reshape(-1, n_features)
+    return counts, counts[:, None] * centers
+
+
+def _nearest(X, centers):
+    distances = ((X[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    labels = distances.argmin(axis=1)
+    return labels, distances[np.arange(len(X)), labels]
+
+
+def append_batch(clustered: pd.DataFrame, result, views, batch: pd.DataFrame, refine=False):
+    """Menambahkan `batch` (baris mentah setelah apply_schema) ke hasil clustering.
+
+    `clustered` adalah frame hasil clustering dengan `attrs["scaler"]` dari preprocessing,
+    `result` adalah ClusterResult (df dan X boleh None; sebaiknya dengan model dari
+    `IncrementalModel.from_model` agar inertia tetap eksak) dan `views` adalah tuple
+    (AggregateCube, ClusterIndex, SkillTable) untuk `clustered`. Dengan `refine=True`
+    centroid digeser ke rata-rata berjalan anggotanya (partial fit); label baris lama tidak
+    dihitung ulang. Mengembalikan (frame gabungan, result baru, views baru).
+    """
+    stats = clustered.attrs.get("scaler")
+    if stats is None or result.encoder is None or result.pca is None:
+        raise ValueError("Hasil clustering ini belum mendukung batch tambahan; ulangi preprocessing dan clustering.")
+    batch = batch.dropna()
+    if batch.empty:
+        raise ValueError("Batch tidak berisi baris yang lengkap (tanpa NaN).")
+
+    # Statistik berjalan Salary_USD; baris lama dipetakan ulang dengan transformasi afin
+    raw = batch["Salary_USD"].to_numpy(dtype=np.float64)
+    old_mean, old_std = stats["mean"], _std(stats["var"])
+    n_samples, mean, var = update_moments(stats["n_samples"], stats["mean"], stats["var"], raw)
+    std = _std(var)
+    scale, shift = old_std / std, (old_mean - mean) / std
+
+    # Fitur baris baru di ruang fitur saat clustering (statistik lama)
+    X = np.asarray(result.encoder.transform(batch.assign(Salary_USD=(raw - old_mean) / old_std)), dtype=np.float64)
+    model = result.model
+    centers = np.asarray(model.cluster_centers_, dtype=np.float64).reshape(-1, X.shape[1])
+    labels, distances = _nearest(X, centers)
+    counts, sums = _membership(model, X.shape[1])
+
+    batch_counts, batch_sums = _cluster_sums(labels, X, len(centers))
+    inertia = float(model.inertia_)
+    if refine:
+        new_counts = counts + batch_counts
+        refined = np.where(
+            new_counts[:, None] > 0, (sums + batch_sums) / np.maximum(new_counts, 1)[:, None], centers
+        )
+        # Jarak kuadrat anggota lama ke centroid baru: ||x-c'||² = ||x-c||² + 2(c-c')·(x-c) + ||c-c'||²
+        moved = centers - refined
+        inertia += float((2 * (moved * (sums - counts[:, None] * centers)).sum(axis=1)
+                          + counts * (moved ** 2).sum(axis=1)).sum())
+        centers = refined
+        distances = ((X - centers[labels]) ** 2).sum(axis=1)
+    inertia += float(distances.sum())
+
+    appended = batch.assign(
+        Salary_USD=((raw - mean) / std).astype(clustered["Salary_USD"].dtype),
+        Cluster=labels.astype(clustered["Cluster"].dtype),
+        PCA1=result.pca.transform(X)[:, 0],
+    )[list(clustered.columns)]
+    if pd.api.types.is_integer_dtype(clustered.index) and len(clustered):
+        start = int(clustered.index.max()) + 1
+        appended.index = pd.RangeIndex(start, start + len(appended))
+    existing = clustered.assign(
+        Salary_USD=(scale * clustered["Salary_USD"].astype(np.float64) + shift).astype(clustered["Salary_USD"].dtype)
+    )
+    combined = pd.concat([schema.align_categories(existing), schema.align_categories(appended)])
+    combined.attrs = {**clustered.attrs, "scaler": {"n_samples": int(n_samples), "mean": float(mean), "var": float(var)}}
+
+    appended = combined.iloc[len(clustered):]
+    cube, index, skill_table = views
+    views = (
+        cube.appended(appended, combined, scale, shift),
+        index.appended(appended, scale, shift),
+        skill_table.appended(appended["Required_Skills"]),
+    )
+    model = IncrementalModel(
+        model.n_clusters, centers, inertia, counts + batch_counts, sums + batch_sums,
+        getattr(model, "batches", 0) + 1,
+    )
+    return combined, result._replace(model=model), views
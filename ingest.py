@@ -0,0 +1,192 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pandas as pd
+
+import metrics
+
+# Lokasi dan batas ukuran cache Parquet hasil parsing file upload
+CACHE_DIR = Path(os.environ.get("TECHNO_CACHE_DIR", Path.home() / ".cache" / "techno"))
+CACHE_MAX_BYTES = int(os.environ.get("TECHNO_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+
+# Jumlah baris per potongan saat membaca file secara streaming
+CHUNK_ROWS = 20_000
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 dari isi file, dipakai sebagai kunci cache."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _cache_path(key: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{key}.parquet"
+
+
+def _evict(cache_dir: Path, max_bytes: int, keep: Path) -> None:
+    # LRU berdasarkan mtime: file yang paling lama tidak dipakai dihapus lebih dulu
+    entries = []
+    for path in cache_dir.glob("*.parquet"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def read_cached(data: bytes, parse, cache_dir=None, max_bytes=None):
+    """Membaca DataFrame dari cache Parquet, atau mem-parsing `data` sekali lalu menyimpannya.
+
+    Mengembalikan tuple (df, key, hit).
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    key = content_hash(data)
+    path = _cache_path(key, cache_dir)
+
+    if path.exists():
+        try:
+            df = pd.read_parquet(path)
+        except Exception:
+            # File cache rusak (misalnya penulisan terputus), parsing ulang
+            path.unlink(missing_ok=True)
+        else:
+            os.utime(path)
+            metrics.count_cache("ingest", True)
+            return df, key, True
+
+    metrics.count_cache("ingest", False)
+    df = parse(data)
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        _evict(cache_dir, max_bytes, keep=path)
+    except Exception:
+        # Cache hanya optimasi; kolom yang tidak bisa ditulis ke Parquet tetap dipakai dari memori
+        tmp_path.unlink(missing_ok=True)
+
+    return df, key, False
+
+
+def _report(progress, fraction):
+    if progress is not None:
+        progress(min(max(fraction, 0.0), 1.0))
+
+
+def _column_names(header):
+    """Nama kolom seperti pd.read_excel: judul kosong menjadi "Unnamed: i", judul berulang
+    menjadi "A.1", "A.2", ... (nomor yang sudah dipakai judul lain dilewati)."""
+    names = [f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(header)]
+    unnamed = [i for i, name in enumerate(header) if name is None]
+    # Kolom bernama diberi nomor lebih dulu agar namanya tetap, baru kolom tanpa judul
+    order = [i for i, name in enumerate(header) if name is not None] + unnamed
+    original = set(names)
+    counts = {}
+    for i in order:
+        name = base = names[i]
+        count = counts.get(base, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def read_xlsx(data: bytes, progress=None, chunk_rows=CHUNK_ROWS):
+    """Membaca sheet pertama secara streaming dengan mode read-only openpyxl."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        columns = _column_names(header)
+        width = len(columns)
+        # max_row bisa None jika dimensi sheet tidak tercatat
+        total_rows = max((sheet.max_row or 0) - 1, 0)
+
+        chunks = []
+        buffers = [[] for _ in range(width)]
+        done = 0
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            for i in range(width):
+                buffers[i].append(row[i] if i < len(row) else None)
+            if len(buffers[0]) >= chunk_rows:
+                chunks.append(pd.DataFrame(dict(zip(columns, buffers))))
+                done += len(buffers[0])
+                buffers = [[] for _ in range(width)]
+                _report(progress, done / total_rows if total_rows else 0.0)
+
+        if buffers[0] or not chunks:
+            chunks.append(pd.DataFrame(dict(zip(columns, buffers))))
+    finally:
+        workbook.close()
+
+    _report(progress, 1.0)
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+
+def read_csv(data: bytes, progress=None, chunk_rows=CHUNK_ROWS):
+    """Membaca CSV per potongan; progres dihitung dari posisi byte."""
+    buffer = io.BytesIO(data)
+    chunks = []
+    for chunk in pd.read_csv(buffer, chunksize=chunk_rows):
+        chunks.append(chunk)
+        _report(progress, buffer.tell() / len(data) if data else 1.0)
+
+    _report(progress, 1.0)
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+def read_parquet(data: bytes, progress=None, chunk_rows=CHUNK_ROWS):
+    """Parquet sudah kolumnar, jadi dibaca langsung tanpa pemotongan."""
+    df = pd.read_parquet(io.BytesIO(data))
+    _report(progress, 1.0)
+    return df
+
+
+# Reader per ekstensi file; format baru cukup didaftarkan lewat register_reader
+READERS = {
+    "xlsx": read_xlsx,
+    "csv": read_csv,
+    "parquet": read_parquet,
+}
+
+
+def register_reader(extension: str, reader) -> None:
+    """Mendaftarkan reader `reader(data, progress=None, chunk_rows=...)` untuk sebuah ekstensi."""
+    READERS[extension.lower().lstrip(".")] = reader
+
+
+def reader_for(filename: str):
+    extension = Path(filename).suffix.lower().lstrip(".")
+    try:
+        return READERS[extension]
+    except KeyError:
+        raise ValueError(f"Format file tidak didukung: .{extension}") from None
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Jumlah job yang boleh berjalan bersamaan di satu server; sisanya antre
+MAX_CONCURRENT_JOBS = int(os.environ.get("TECHNO_MAX_JOBS", max(1, (os.cpu_count() or 2) // 2)))
+
+# Jatah CPU satu job (proses sweep sklearn dan thread OpenMP), agar job yang berjalan
+# bersamaan tidak memakai lebih dari jumlah CPU server
+WORKERS_PER_JOB = max(1, (os.cpu_count() or 1) // MAX_CONCURRENT_JOBS)
+
+# Job yang sudah selesai tetapi tidak pernah diambil dibuang setelah sekian detik
+FINISHED_JOB_TTL = 3600
+
+PENDING = "menunggu"
+RUNNING = "berjalan"
+DONE = "selesai"
+CANCELLED = "dibatalkan"
+FAILED = "gagal"
+
+
+class JobCancelled(Exception):
+    """Dilempar dari callback progres ketika job diminta berhenti."""
+
+
+class Job:
+    def __init__(self, owner, fn, args, kwargs):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = "Menunggu giliran..."
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, CANCELLED, FAILED)
+
+    def report(self, fraction, message=None):
+        """Callback progres untuk fungsi job; sekaligus titik pemeriksaan pembatalan."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+    def cancel(self):
+        self._cancel.set()
+
+
+class JobQueue:
+    """Antrean job latar belakang yang dipakai bersama oleh semua sesi.
+
+    Setiap pemilik (sesi) hanya punya satu job aktif; job baru menggantikan job lama
+    pemilik yang sama, sehingga antrean FIFO tetap adil antar pengguna.
+    """
+
+    def __init__(self, max_workers=MAX_CONCURRENT_JOBS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="techno-job")
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._running = 0
+        self._jobs = {}
+
+    def submit(self, owner, fn, *args, **kwargs) -> Job:
+        """Menjadwalkan `fn(*args, progress=job.report, **kwargs)` di latar belakang."""
+        job = Job(owner, fn, args, kwargs)
+        with self._lock:
+            self._prune()
+            for other in self._jobs.values():
+                if other.owner == owner and not other.finished:
+                    self._cancel_locked(other)
+            self._jobs[job.id] = job
+            self._pending.append(job)
+        self._dispatch()
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def pop(self, job_id):
+        with self._lock:
+            return self._jobs.pop(job_id, None)
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._cancel_locked(job)
+
+    def position(self, job) -> int:
+        """Posisi job di antrean (1 = berikutnya), atau 0 jika tidak sedang antre."""
+        with self._lock:
+            for position, pending in enumerate(self._pending, start=1):
+                if pending is job:
+                    return position
+        return 0
+
+    def _cancel_locked(self, job):
+        job.cancel()
+        if job.status == PENDING:
+            job.status = CANCELLED
+            job.message = "Dibatalkan."
+            job.finished_at = time.time()
+            self._pending.remove(job)
+
+    def _prune(self):
+        expired = time.time() - FINISHED_JOB_TTL
+        # finished_at None berarti job belum selesai (status akhir dan waktunya diisi bersamaan)
+        for job_id in [
+            j.id for j in self._jobs.values()
+            if j.finished and j.finished_at is not None and j.finished_at < expired
+        ]:
+            del self._jobs[job_id]
+
+    def _dispatch(self):
+        with self._lock:
+            while self._running < self.max_workers and self._pending:
+                job = self._pending.popleft()
+                job.status = RUNNING
+                job.message = "Memulai..."
+                self._running += 1
+                self._executor.submit(self._run, job)
+
+    def _run(self, job):
+        status, message = FAILED, "Gagal."
+        try:
+            job.result = job._fn(*job._args, progress=job.report, **job._kwargs)
+            status, message = DONE, "Selesai."
+        except JobCancelled:
+            status, message = CANCELLED, "Dibatalkan."
+        except Exception as exc:
+            job.error = exc
+            status, message = FAILED, f"Gagal: {exc}"
+        finally:
+            job._args = job._kwargs = None
+            with self._lock:
+                # Status akhir dan finished_at diisi bersamaan di bawah kunci yang sama dengan _prune
+                if status == DONE:
+                    job.progress = 1.0
+                job.status, job.message, job.finished_at = status, message, time.time()
+                self._running -= 1
+            self._dispatch()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def queue() -> JobQueue:
+    """Antrean job bersama untuk seluruh proses server."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue()
+        return _queue
@@ -0,0 +1,250 @@
+"""Pengukuran waktu dan memori per tahap serta rasio cache, untuk panel Performance dan ekspor.
+
+Setiap rerun halaman mencatat span (waktu, RSS, dan kolom tambahan seperti ukuran payload
+grafik) lewat `Recorder`. Kode analisis cukup memanggil `span(nama)`; tanpa recorder aktif
+di thread tersebut span tidak dicatat. Jika TECHNO_METRICS_PATH diisi, setiap rerun
+diekspor: file berakhiran .prom ditulis ulang dalam format teks Prometheus (total per
+proses, cocok untuk textfile collector), selain itu satu baris JSON ditambahkan per rerun.
+Path boleh memuat {host} dan {pid} agar setiap proses server menulis filenya sendiri.
+"""
+import contextvars
+import json
+import os
+import random
+import resource
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+METRICS_PATH = os.environ.get("TECHNO_METRICS_PATH")
+
+# Fraksi grafik yang ukuran payload-nya diukur. Pengukuran menserialisasi figure sekali
+# lagi, jadi secara default hanya dilakukan jika metrik diekspor.
+PAYLOAD_SAMPLE_RATE = float(os.environ.get("TECHNO_METRICS_PAYLOAD_SAMPLE", 1.0 if METRICS_PATH else 0.0))
+
+_current = contextvars.ContextVar("techno_metrics_recorder", default=None)
+
+# Hit/miss cache per nama, sejak proses dimulai
+_caches = {}
+_caches_lock = threading.Lock()
+
+# Total per tahap untuk ekspor Prometheus, sejak proses dimulai
+_totals = {"reruns": {}, "stages": {}}
+_export_lock = threading.Lock()
+
+
+def rss_bytes() -> int:
+    """Resident set size proses saat ini, dalam byte."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Tanpa /proc (misalnya macOS): puncak sepanjang umur proses, dalam byte di macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def payload_bytes(chart) -> int:
+    """Ukuran yang dikirim ke browser: PNG untuk word cloud, JSON figure untuk Plotly."""
+    return len(chart) if isinstance(chart, bytes) else len(chart.to_json().encode())
+
+
+def sample_payload(rate=None) -> bool:
+    """True jika ukuran payload grafik ini perlu diukur (lihat PAYLOAD_SAMPLE_RATE)."""
+    rate = PAYLOAD_SAMPLE_RATE if rate is None else rate
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def count_cache(name: str, hit: bool) -> None:
+    with _caches_lock:
+        stats = _caches.setdefault(name, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+
+def cache_stats() -> dict:
+    """Salinan hit/miss semua cache yang tercatat, per nama cache."""
+    with _caches_lock:
+        return {name: dict(stats) for name, stats in _caches.items()}
+
+
+def hit_rate(stats: dict):
+    total = stats["hits"] + stats["misses"]
+    return stats["hits"] / total if total else None
+
+
+class Recorder:
+    """Span satu rerun halaman (atau satu job latar) beserta labelnya.
+
+    Dipakai sebagai context manager, atau dengan `start()`/`finish()` bila rerun bisa
+    berhenti di tengah (misalnya oleh st.rerun).
+    """
+
+    def __init__(self, name: str, **labels):
+        self.name = name
+        self.labels = labels
+        self.spans = []
+        self.seconds = None
+        self._depth = 0
+        self._started = None
+        self._token = None
+
+    def start(self) -> "Recorder":
+        self._started = time.perf_counter()
+        self._token = _current.set(self)
+        return self
+
+    def finish(self) -> "Recorder":
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self.seconds = time.perf_counter() - self._started
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.finish()
+
+    @contextmanager
+    def span(self, name: str, **fields):
+        """Mencatat waktu dan perubahan RSS blok ini; kolom tambahan boleh diisi ke record."""
+        # Record ditambahkan saat span dimulai, sehingga rincian mengikuti urutan mulai
+        record = {"name": name, "depth": self._depth, **fields}
+        self.spans.append(record)
+        before = rss_bytes()
+        started = time.perf_counter()
+        self._depth += 1
+        try:
+            yield record
+        finally:
+            self._depth -= 1
+            after = rss_bytes()
+            record.update(seconds=time.perf_counter() - started, rss_bytes=after, rss_delta_bytes=after - before)
+
+    def extend(self, spans, prefix="") -> None:
+        """Menambahkan span dari recorder lain (misalnya job latar) ke rincian ini."""
+        for span in spans:
+            self.spans.append({**span, "name": prefix + span["name"], "depth": self._depth + span["depth"]})
+
+
+@contextmanager
+def span(name: str, **fields):
+    """Span pada recorder yang aktif di thread ini; tanpa recorder hanya menjalankan blok."""
+    recorder = _current.get()
+    if recorder is None:
+        yield dict(fields)
+        return
+    with recorder.span(name, **fields) as record:
+        yield record
+
+
+def span_table(recorder: Recorder) -> list:
+    """Baris rincian span untuk ditampilkan sebagai tabel."""
+    return [
+        {
+            "Tahap": "  " * span["depth"] + span["name"],
+            "Waktu (s)": round(span["seconds"], 3),
+            "Δ RSS (MB)": round(span["rss_delta_bytes"] / 1024 ** 2, 1),
+            "Payload (KB)": round(span["payload_bytes"] / 1024, 1) if "payload_bytes" in span else None,
+        }
+        for span in recorder.spans
+    ]
+
+
+def cache_table(caches: dict) -> list:
+    rows = []
+    for name, stats in caches.items():
+        rate = hit_rate(stats)
+        rows.append({
+            "Cache": name,
+            "Hit": stats["hits"],
+            "Miss": stats["misses"],
+            "Rasio Hit": f"{rate:.0%}" if rate is not None else "-",
+        })
+    return rows
+
+
+def _target(path) -> Path:
+    return Path(str(path).format(host=socket.gethostname(), pid=os.getpid()))
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus(caches: dict, gauges: dict) -> str:
+    lines = [
+        "# HELP techno_reruns_total Jumlah rerun halaman yang tercatat.",
+        "# TYPE techno_reruns_total counter",
+        *(f'techno_reruns_total{{page="{_label(page)}"}} {count}' for page, count in _totals["reruns"].items()),
+        "# HELP techno_stage_seconds Waktu per tahap halaman dan job clustering.",
+        "# TYPE techno_stage_seconds summary",
+    ]
+    stages = _totals["stages"]
+    for stage, total in stages.items():
+        lines.append(f'techno_stage_seconds_sum{{stage="{_label(stage)}"}} {total["seconds"]:.6f}')
+        lines.append(f'techno_stage_seconds_count{{stage="{_label(stage)}"}} {total["count"]}')
+    lines += ["# HELP techno_stage_rss_delta_bytes Perubahan RSS pada eksekusi terakhir tahap.",
+              "# TYPE techno_stage_rss_delta_bytes gauge"]
+    lines += [f'techno_stage_rss_delta_bytes{{stage="{_label(stage)}"}} {total["rss_delta_bytes"]}'
+              for stage, total in stages.items()]
+    lines += ["# HELP techno_stage_payload_bytes Ukuran payload grafik yang dikirim ke browser.",
+              "# TYPE techno_stage_payload_bytes summary"]
+    for stage, total in stages.items():
+        if total["payload_count"]:
+            lines.append(f'techno_stage_payload_bytes_sum{{stage="{_label(stage)}"}} {total["payload_bytes"]}')
+            lines.append(f'techno_stage_payload_bytes_count{{stage="{_label(stage)}"}} {total["payload_count"]}')
+    for kind in ("hits", "misses"):
+        lines += [f"# HELP techno_cache_{kind}_total Jumlah {kind} per cache.",
+                  f"# TYPE techno_cache_{kind}_total counter"]
+        lines += [f'techno_cache_{kind}_total{{cache="{_label(name)}"}} {stats[kind]}'
+                  for name, stats in caches.items()]
+    for name, value in {"process_rss_bytes": rss_bytes(), **gauges}.items():
+        lines += [f"# TYPE techno_{name} gauge", f"techno_{name} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def export(recorder: Recorder, caches: dict, gauges=None, path=METRICS_PATH) -> None:
+    """Mengekspor satu rerun ke `path` (Prometheus untuk .prom, selain itu JSON lines)."""
+    if not path:
+        return
+    gauges = gauges or {}
+    target = _target(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with _export_lock:
+        if target.suffix == ".prom":
+            _totals["reruns"][recorder.name] = _totals["reruns"].get(recorder.name, 0) + 1
+            for span in recorder.spans:
+                total = _totals["stages"].setdefault(span["name"], {
+                    "seconds": 0.0, "count": 0, "rss_delta_bytes": 0, "payload_bytes": 0, "payload_count": 0,
+                })
+                total["seconds"] += span["seconds"]
+                total["count"] += 1
+                total["rss_delta_bytes"] = span["rss_delta_bytes"]
+                if "payload_bytes" in span:
+                    total["payload_bytes"] += span["payload_bytes"]
+                    total["payload_count"] += 1
+            # Ditulis ke file sementara lalu diganti agar collector tidak membaca file setengah jadi
+            tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(_prometheus(caches, gauges))
+            os.replace(tmp_path, target)
+        else:
+            record = {
+                "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                "host": socket.gethostname(),
+                "pid": os.getpid(),
+                "page": recorder.name,
+                **recorder.labels,
+                "seconds": recorder.seconds,
+                "rss_bytes": rss_bytes(),
+                "spans": recorder.spans,
+                "caches": caches,
+                **gauges,
+            }
+            with open(target, "a", encoding="utf-8") as log:
+                log.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
@@ -0,0 +1,280 @@
+"""Alur analisis tanpa Streamlit: ingest → preprocessing → K-Means → elbow → visualisasi.
+
+Dipakai oleh halaman Analisis Data dan bisa dijalankan dari command line, misalnya:
+
+    python pipeline.py data/ --output hasil/ --k 3 --engine exact --workers 4
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+import clustering
+import features
+import ingest
+import metrics
+import rendering
+import schema
+
+# Rentang k untuk Elbow Method; k yang dipilih harus berada di dalamnya
+ELBOW_RANGE = range(2, 11)
+ENGINES = ("exact", "sklearn", "minibatch")
+
+
+class ClusterResult(NamedTuple):
+    df: pd.DataFrame
+    model: object
+    models: dict
+    X: np.ndarray
+    feature_names: list
+    silhouette: clustering.SilhouetteResult
+    encoder: features.FeatureEncoder = None
+    pca: object = None
+
+    @property
+    def wcss(self) -> list:
+        return [self.models[k].inertia_ for k in self.models]
+
+
+def load_dataset(path, progress=None, cache_dir=None) -> pd.DataFrame:
+    """Membaca file XLSX/CSV/Parquet lewat cache Parquet dan menerapkan skema kategori."""
+    path = Path(path)
+    reader = ingest.reader_for(path.name)
+    df, _, cache_hit = ingest.read_cached(
+        path.read_bytes(), lambda data: schema.apply_schema(reader(data, progress=progress)), cache_dir
+    )
+    return schema.apply_schema(df) if cache_hit else df
+
+
+def preprocess(df: pd.DataFrame) -> pd.DataFrame:
+    """Menghapus baris dengan NaN lalu menstandarisasi Salary_USD.
+
+    Statistik standarisasi dicatat di `df.attrs["scaler"]` agar batch tambahan bisa
+    distandarisasi dengan statistik berjalan (lihat incremental.py).
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    df = df.dropna()
+    scaler = StandardScaler()
+    columns_to_scale = ["Salary_USD"]
+    df[columns_to_scale] = scaler.fit_transform(df[columns_to_scale])
+    df.attrs["scaler"] = {
+        "n_samples": int(scaler.n_samples_seen_),
+        "mean": float(scaler.mean_[0]),
+        "var": float(scaler.var_[0]),
+    }
+    return df
+
+
+def cluster(df: pd.DataFrame, k=3, engine="exact", max_workers=None, progress=None) -> ClusterResult:
+    """K-Means untuk seluruh ELBOW_RANGE (dimemo), lalu memakai model untuk `k`.
+
+    Frame hasil berisi kolom Cluster dan PCA1. `progress(fraksi, pesan)` dipanggil di
+    antara tahap; callback boleh melempar exception untuk menghentikan proses.
+    """
+    from sklearn.decomposition import PCA
+
+    if k not in ELBOW_RANGE:
+        raise ValueError(f"k harus di antara {ELBOW_RANGE.start} dan {ELBOW_RANGE.stop - 1}")
+    report = progress or (lambda fraction, message=None: None)
+
+    report(0.0, "Menyiapkan fitur...")
+    # Engine minibatch memakai matriks fitur float32 dari beberapa kolom (ordinal, one-hot,
+    # jumlah keterampilan); engine lain hanya Salary_USD
+    with metrics.span("features"):
+        encoder = features.FeatureEncoder(multi_feature=engine == "minibatch")
+        X = encoder.fit_transform(df)
+    feature_names = encoder.names
+
+    report(0.1, "Melatih K-Means untuk Elbow Method...")
+    with metrics.span("elbow_sweep", engine=engine):
+        models = clustering.elbow_sweep(
+            X, ELBOW_RANGE, engine=engine, max_workers=max_workers,
+            progress=lambda done, total: report(0.1 + 0.6 * done / total, f"K-Means selesai untuk {done}/{total} nilai k")
+        )
+    model = models[k]
+    report(0.75, "Menghitung PCA...")
+    with metrics.span("pca"):
+        pca = PCA(n_components=1)
+        # Frame baru dengan kolom tambahan; kolom frame masukan dipakai bersama, tidak disalin
+        df = df.assign(Cluster=model.labels_.copy(), PCA1=pca.fit_transform(X)[:, 0])
+    report(0.85, "Menghitung Silhouette Score...")
+    with metrics.span("silhouette") as span:
+        silhouette = clustering.silhouette(X, model.labels_)
+        span["method"] = silhouette.method
+    report(1.0, "Selesai.")
+    return ClusterResult(df, model, models, X, feature_names, silhouette, encoder, pca)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def write_charts(result: ClusterResult, directory: Path, render_mode=rendering.MODE_AUTO,
+                 point_threshold=rendering.POINT_THRESHOLD) -> list:
+    """Menulis semua grafik sebagai HTML (figure Plotly) atau PNG (word cloud)."""
+    import charts
+
+    directory.mkdir(parents=True, exist_ok=True)
+    ctx = charts.chart_context(result.df, render_mode, point_threshold)
+    figures = {
+        "Visualisasi PCA (1 Komponen)": charts.pca_figure(result.df, render_mode, point_threshold)[0],
+        "Elbow Method": charts.elbow_figure(result.models, result.wcss),
+    }
+    for title in charts.CHARTS:
+        figures[title] = charts.build(title, ctx)[0]
+
+    written = []
+    for number, (title, chart) in enumerate(figures.items(), start=1):
+        stem = f"{number:02d}-{_slug(title)}"
+        if isinstance(chart, bytes):
+            path = directory / f"{stem}.png"
+            path.write_bytes(chart)
+        else:
+            path = directory / f"{stem}.html"
+            # plotly.min.js ditulis sekali di folder yang sama dan dipakai semua grafik
+            chart.write_html(path, include_plotlyjs="directory")
+        written.append(path.name)
+    return written
+
+
+def run(path, output_dir, k=3, engine="exact", render_mode=rendering.MODE_AUTO,
+        point_threshold=rendering.POINT_THRESHOLD, max_workers=None) -> dict:
+    """Menjalankan seluruh alur untuk satu file dan menulis hasilnya ke `output_dir/<nama file>`.
+
+    Nama folder memuat ekstensi (misalnya `data.xlsx`), sehingga `data.xlsx` dan `data.csv`
+    tidak saling menimpa.
+    """
+    path = Path(path)
+    target = Path(output_dir) / path.name
+    target.mkdir(parents=True, exist_ok=True)
+    timings = {}
+
+    started = time.perf_counter()
+    raw = load_dataset(path)
+    timings["ingest"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    preprocessed = preprocess(raw)
+    timings["preprocess"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = cluster(preprocessed, k, engine, max_workers)
+    timings["cluster"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result.df.to_parquet(target / "clustered.parquet", index=False)
+    chart_files = write_charts(result, target / "charts", render_mode, point_threshold)
+    timings["export"] = time.perf_counter() - started
+
+    silhouette = result.silhouette
+    summary = {
+        "file": str(path),
+        "rows": int(len(raw)),
+        "rows_after_preprocessing": int(len(preprocessed)),
+        "k": k,
+        "engine": engine,
+        "features": result.feature_names,
+        "inertia": float(result.model.inertia_),
+        "silhouette": {
+            "score": silhouette.score,
+            "method": silhouette.method,
+            "seconds": silhouette.seconds,
+            "ci_low": silhouette.ci_low,
+            "ci_high": silhouette.ci_high,
+            "sample_size": silhouette.sample_size,
+        },
+        "elbow_wcss": {str(i): float(w) for i, w in zip(result.models, result.wcss)},
+        "centroids": np.asarray(result.model.cluster_centers_).tolist(),
+        "cluster_sizes": np.bincount(result.model.labels_, minlength=k).tolist(),
+        "charts": chart_files,
+        "timings_seconds": timings,
+    }
+    (target / "metrics.json").write_text(json.dumps(summary, indent=2, ensure_ascii=False))
+    return summary
+
+
+def _input_files(paths) -> list:
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(
+                child for child in path.iterdir()
+                if child.suffix.lower().lstrip(".") in ingest.READERS and not child.name.startswith("~$")
+            ))
+        else:
+            files.append(path)
+    return files
+
+
+def _name_collisions(files) -> dict:
+    """Nama file yang dipakai lebih dari satu input (folder keluarannya akan bertabrakan)."""
+    by_name = {}
+    for path in files:
+        by_name.setdefault(path.name, []).append(path)
+    return {name: paths for name, paths in by_name.items() if len(paths) > 1}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Analisis pasar kerja berbasis AI tanpa Streamlit.")
+    parser.add_argument("inputs", nargs="+", help="file XLSX/CSV/Parquet atau folder berisi file tersebut")
+    parser.add_argument("-o", "--output", default="hasil", help="folder keluaran (default: hasil)")
+    parser.add_argument("-k", "--k", type=int, default=3, help="jumlah cluster (2-10, default: 3)")
+    parser.add_argument("--engine", choices=ENGINES, default="exact", help="metode clustering")
+    parser.add_argument("--render-mode", choices=(rendering.MODE_AUTO, rendering.MODE_HEATMAP, rendering.MODE_FULL),
+                        default=rendering.MODE_AUTO, help="mode render grafik per titik")
+    parser.add_argument("--point-threshold", type=int, default=rendering.POINT_THRESHOLD,
+                        help="batas jumlah titik sebelum sampling/heatmap")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="jumlah proses paralel untuk banyak file (default: jumlah CPU)")
+    args = parser.parse_args(argv)
+
+    files = _input_files(args.inputs)
+    if not files:
+        parser.error("tidak ada file XLSX/CSV/Parquet yang ditemukan")
+    collisions = _name_collisions(files)
+    if collisions:
+        parser.error("nama file yang sama dari folder berbeda akan saling menimpa hasilnya: " + "; ".join(
+            ", ".join(map(str, paths)) for paths in collisions.values()
+        ))
+
+    options = dict(k=args.k, engine=args.engine, render_mode=args.render_mode,
+                   point_threshold=args.point_threshold)
+    failures = 0
+    if len(files) == 1 or args.workers == 1:
+        outcomes = [(path, _run_safely(path, args.output, options)) for path in files]
+    else:
+        # Setiap file diproses di proses terpisah; sweep sklearn di dalamnya dibuat serial
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [
+                (path, pool.submit(_run_safely, path, args.output, dict(options, max_workers=1)))
+                for path in files
+            ]
+            outcomes = [(path, future.result()) for path, future in futures]
+
+    for path, (summary, error) in outcomes:
+        if error is None:
+            print(f"{path}: {summary['rows']} baris, k={summary['k']}, "
+                  f"silhouette={summary['silhouette']['score']:.3f}")
+        else:
+            failures += 1
+            print(f"{path}: GAGAL - {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _run_safely(path, output_dir, options):
+    try:
+        return run(path, output_dir, **options), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+# Mode render untuk grafik dengan satu marker per baris
+MODE_AUTO = "auto"
+MODE_HEATMAP = "heatmap"
+MODE_FULL = "full"
+
+# Di atas jumlah titik ini grafik disampel (atau diringkas menjadi heatmap)
+POINT_THRESHOLD = 20_000
+
+# Di atas jumlah titik ini trace memakai WebGL walaupun tidak disampel
+WEBGL_MIN_POINTS = 1_000
+
+HEATMAP_BINS = 50
+
+
+def downsample(df: pd.DataFrame, n: int, random_state=42) -> pd.DataFrame:
+    """Sampel acak seragam; kepadatan titik di setiap wilayah grafik tetap proporsional."""
+    if len(df) <= n:
+        return df
+    return df.sample(n=n, random_state=random_state)
+
+
+def _binned_axis(series: pd.Series):
+    if pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+        edges = np.histogram_bin_edges(series.dropna(), bins=HEATMAP_BINS)
+        centers = (edges[:-1] + edges[1:]) / 2
+        codes = np.clip(np.searchsorted(edges, series, side="right") - 1, 0, HEATMAP_BINS - 1)
+        return pd.Series(centers[codes], index=series.index).round(4)
+    return series
+
+
+def binned_heatmap(df: pd.DataFrame, x: str, y: str, title=None):
+    """Heatmap 2-D yang jumlah per sel-nya dihitung di server."""
+    import plotly.express as px
+
+    counts = df.groupby([_binned_axis(df[x]), _binned_axis(df[y])], observed=True).size()
+    grid = counts.unstack(fill_value=0).T
+    return px.imshow(
+        grid,
+        origin="lower",
+        aspect="auto",
+        color_continuous_scale="Viridis",
+        labels=dict(x=x, y=y, color="Jumlah"),
+        title=title,
+    )
+
+
+def scatter(df: pd.DataFrame, x: str, y: str, mode=MODE_AUTO, threshold=POINT_THRESHOLD, **kwargs):
+    """Scatter plot yang tetap ringan untuk data besar.
+
+    Mengembalikan (fig, keterangan) dengan keterangan jumlah titik yang ditampilkan.
+    """
+    import plotly.express as px
+
+    n = len(df)
+    if mode == MODE_FULL or n <= threshold:
+        render_mode = "webgl" if n > WEBGL_MIN_POINTS else "auto"
+        fig = px.scatter(df, x=x, y=y, render_mode=render_mode, **kwargs)
+        return fig, f"Menampilkan seluruh {n:,} titik."
+
+    if mode == MODE_HEATMAP:
+        fig = binned_heatmap(df, x, y, title=kwargs.get("title"))
+        return fig, f"{n:,} titik diringkas menjadi heatmap 2-D."
+
+    sample = downsample(df, threshold)
+    fig = px.scatter(sample, x=x, y=y, render_mode="webgl", **kwargs)
+    return fig, f"Menampilkan sampel acak {len(sample):,} dari {n:,} titik (WebGL)."
+
+
+def violin(df: pd.DataFrame, x: str, y: str, mode=MODE_AUTO, threshold=POINT_THRESHOLD, **kwargs):
+    """Violin plot; di atas batas titik kepadatannya diestimasi dari sampel acak."""
+    import plotly.express as px
+
+    n = len(df)
+    if mode == MODE_FULL or n <= threshold:
+        return px.violin(df, x=x, y=y, **kwargs), f"Menampilkan seluruh {n:,} titik."
+
+    sample = downsample(df, threshold)
+    fig = px.violin(sample, x=x, y=y, points=False, **kwargs)
+    return fig, f"Distribusi diestimasi dari sampel acak {len(sample):,} dari {n:,} titik."
@@ -0,0 +1,77 @@
+import threading
+
+import pandas as pd
+
+# Kolom teks dengan kardinalitas rendah yang disimpan sebagai Categorical
+CATEGORICAL_COLUMNS = [
+    "Job_Title",
+    "Industry",
+    "Location",
+    "Company_Size",
+    "Automation_Risk",
+    "AI_Adoption_Level",
+    "Remote_Friendly",
+    "Job_Growth_Projection",
+]
+
+# Urutan kategori yang bermakna; kolom lain diurutkan alfabetis
+CATEGORY_ORDER = {
+    "Company_Size": ["Small", "Medium", "Large"],
+    "Automation_Risk": ["Low", "Medium", "High"],
+    "AI_Adoption_Level": ["Low", "Medium", "High"],
+    "Remote_Friendly": ["No", "Yes"],
+    "Job_Growth_Projection": ["Decline", "Stable", "Growth"],
+}
+
+# Kamus kategori bersama untuk seluruh proses. Kategori hanya pernah ditambahkan di
+# akhir, sehingga kode kategori tetap stabil antar sesi dan antar dataset.
+_DICTIONARY = {}
+_DICTIONARY_LOCK = threading.Lock()
+
+
+def category_dtype(column: str, values=()) -> pd.CategoricalDtype:
+    """CategoricalDtype bersama untuk `column`, diperluas dengan nilai baru dari `values`."""
+    with _DICTIONARY_LOCK:
+        dtype = _DICTIONARY.get(column)
+        known = list(dtype.categories) if dtype is not None else list(CATEGORY_ORDER.get(column, []))
+        seen = set(known)
+        new = sorted({value for value in values if value not in seen}, key=str)
+        if dtype is None or new:
+            dtype = pd.CategoricalDtype(known + new)
+            _DICTIONARY[column] = dtype
+        return dtype
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def align_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Mengubah kolom kategori ke CategoricalDtype bersama tanpa menyentuh kolom lain."""
+    df = df.copy(deep=False)
+    for column in CATEGORICAL_COLUMNS:
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.categories
+        else:
+            values = series.dropna().unique()
+        df[column] = series.astype(category_dtype(column, values))
+    return df
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Mengubah kolom kategori ke Categorical bersama dan menurunkan presisi Salary_USD.
+
+    Penggunaan memori sebelum dan sesudah dicatat di `df.attrs["memory"]`.
+    """
+    before = df.attrs.get("memory", {}).get("before", memory_usage(df))
+    df = align_categories(df)
+
+    if "Salary_USD" in df.columns:
+        # Sel yang bukan angka menjadi NaN dan dibuang oleh dropna saat preprocessing
+        df["Salary_USD"] = pd.to_numeric(df["Salary_USD"], errors="coerce").astype("float32")
+
+    df.attrs["memory"] = {"before": before, "after": memory_usage(df)}
+    return df
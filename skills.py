@@ -0,0 +1,88 @@
+import copy
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import metrics
+
+WORDCLOUD_WIDTH = 800
+WORDCLOUD_HEIGHT = 400
+
+# Jumlah gambar word cloud yang disimpan di memori proses
+PNG_CACHE_SIZE = 16
+_png_cache = OrderedDict()
+_png_cache_lock = threading.Lock()
+
+
+class SkillTable:
+    """Tokenisasi Required_Skills yang dijalankan sekali per dataset.
+
+    Keterampilan dipecah per kata seperti pada grafik Skill_Count. Teks yang sama
+    hanya ditokenisasi sekali, lalu hasilnya diboboti jumlah kemunculannya.
+    `frequencies` berisi Skill dan Count, `counts` berisi jumlah keterampilan per baris.
+    """
+
+    def __init__(self, skills: pd.Series):
+        codes, uniques = pd.factorize(skills, use_na_sentinel=True)
+        tokens = pd.Series(uniques, dtype=object).astype(str).str.split()
+        token_counts = tokens.str.len().to_numpy()
+
+        valid = codes >= 0
+        self.counts = np.zeros(len(codes), dtype=np.int64)
+        self.counts[valid] = token_counts[codes[valid]]
+        occurrences = np.bincount(codes[valid], minlength=len(uniques))
+
+        exploded = tokens.explode().dropna()
+        weights = occurrences[exploded.index.to_numpy()]
+        frequencies = pd.Series(weights, index=exploded.to_numpy()).groupby(level=0).sum()
+        self.frequencies = (
+            frequencies.sort_values(ascending=False, kind="stable")
+            .rename_axis("Skill")
+            .reset_index(name="Count")
+        )
+
+    def appended(self, skills: pd.Series) -> "SkillTable":
+        """Tabel baru untuk baris lama ditambah `skills`; hanya baris baru yang ditokenisasi."""
+        batch = SkillTable(skills)
+        table = copy.copy(self)
+        table.counts = np.concatenate([self.counts, batch.counts])
+        frequencies = pd.concat([self.frequencies, batch.frequencies]).groupby("Skill")["Count"].sum()
+        table.frequencies = frequencies.sort_values(ascending=False, kind="stable").reset_index()
+        return table
+
+    def wordcloud_png(self) -> bytes:
+        return wordcloud_png(self.frequencies)
+
+
+def skill_count(skills: pd.Series) -> np.ndarray:
+    """Jumlah keterampilan per baris dari tahap tokenisasi yang sama."""
+    return SkillTable(skills).counts
+
+
+def wordcloud_png(frequencies: pd.DataFrame, width=WORDCLOUD_WIDTH, height=WORDCLOUD_HEIGHT) -> bytes:
+    """Gambar PNG word cloud dari tabel frekuensi, disimpan di cache per isi tabel."""
+    key = (tuple(zip(frequencies["Skill"], frequencies["Count"].astype(int))), width, height)
+    with _png_cache_lock:
+        if key in _png_cache:
+            _png_cache.move_to_end(key)
+            metrics.count_cache("wordcloud", True)
+            return _png_cache[key]
+    metrics.count_cache("wordcloud", False)
+
+    from wordcloud import WordCloud
+
+    image = WordCloud(width=width, height=height).generate_from_frequencies(
+        dict(zip(frequencies["Skill"], frequencies["Count"]))
+    ).to_image()
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    png = buffer.getvalue()
+
+    with _png_cache_lock:
+        _png_cache[key] = png
+        while len(_png_cache) > PNG_CACHE_SIZE:
+            _png_cache.popitem(last=False)
+    return png
@@ -0,0 +1,95 @@
+import math
+import weakref
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+_NO_SORT = "(urutan asli)"
+_NO_FILTER = "(tanpa filter)"
+
+
+def _sort_order(df: pd.DataFrame, column: str, descending: bool, key: str, data_key=None) -> np.ndarray:
+    # Urutan baris untuk seluruh frame disimpan di session state; hanya dihitung ulang
+    # jika data, kolom, atau arah pengurutan berubah. Tanpa `data_key` frame dikenali lewat
+    # weakref (bukan id(), yang bisa dipakai ulang oleh frame lain setelah garbage collection)
+    cache_key = f"{key}_sort_order"
+    signature = (data_key, len(df), column, descending)
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        frame_ref = cached[1]
+        if data_key is not None or frame_ref() is df:
+            return cached[2]
+
+    values = pd.Series(df[column].array)
+    order = values.sort_values(ascending=not descending, kind="stable").index.to_numpy()
+    st.session_state[cache_key] = (signature, None if data_key is not None else weakref.ref(df), order)
+    return order
+
+
+def _filter_mask(df: pd.DataFrame, column: str, key: str):
+    series = df[column]
+    if pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+        low, high = float(series.min()), float(series.max())
+        if not low < high:
+            return None
+        selected = st.slider(f"Rentang {column}", low, high, (low, high), key=f"{key}_range_{column}")
+        if selected == (low, high):
+            return None
+        return series.between(*selected).to_numpy()
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        options = list(series.cat.remove_unused_categories().cat.categories)
+    else:
+        options = sorted(series.dropna().unique(), key=str)
+    selected = st.multiselect(f"Nilai {column}", options, key=f"{key}_values_{column}")
+    if not selected:
+        return None
+    return series.isin(selected).to_numpy()
+
+
+def paginated_table(df: pd.DataFrame, key: str, rows=None, page_sizes=PAGE_SIZES, data_key=None) -> None:
+    """Menampilkan `df` per halaman dengan kontrol urut dan filter.
+
+    Pengurutan, filter, dan pemotongan halaman dilakukan di server; hanya baris pada
+    halaman yang terlihat yang dikirim ke browser. `rows` (posisi baris) membatasi
+    tampilan ke sebagian frame tanpa menyalinnya. `data_key` (misalnya kunci dataset di
+    penyimpanan bersama beserta versinya) menandai isi frame, sehingga urutan baris tetap
+    dipakai lagi walaupun objek frame baru dibuat setiap rerun.
+    """
+    sort_col, order_col, filter_col, size_col = st.columns(4)
+    sort_column = sort_col.selectbox("Urutkan", [_NO_SORT, *df.columns], key=f"{key}_sort")
+    descending = order_col.checkbox("Menurun", key=f"{key}_descending")
+    filter_column = filter_col.selectbox("Filter", [_NO_FILTER, *df.columns], key=f"{key}_filter")
+    page_size = size_col.selectbox("Baris per halaman", page_sizes, key=f"{key}_page_size")
+
+    keep = np.ones(len(df), dtype=bool) if rows is None else np.zeros(len(df), dtype=bool)
+    if rows is not None:
+        keep[rows] = True
+    if filter_column != _NO_FILTER:
+        mask = _filter_mask(df, filter_column, key)
+        if mask is not None:
+            keep &= mask
+
+    if sort_column != _NO_SORT:
+        order = _sort_order(df, sort_column, descending, key, data_key)
+        positions = order[keep[order]]
+    else:
+        positions = np.flatnonzero(keep)
+
+    total = positions.size
+    pages = max(1, math.ceil(total / page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input(f"Halaman (dari {pages:,})", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    window = positions[start:start + page_size]
+    st.dataframe(df.iloc[window])
+    if total:
+        st.caption(f"Baris {start + 1:,}–{start + window.size:,} dari {total:,} (total data {len(df):,} baris)")
+    else:
+        st.caption(f"Tidak ada baris yang cocok (total data {len(df):,} baris)")
@@ -1,13 +1,9 @@
+import uuid
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-from sklearn.metrics import silhouette_score
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+
+# Modul analisis (pandas, scikit-learn, Plotly, word cloud) dimuat saat halamannya dibuka,
+# sehingga halaman Home tidak ikut menanggung waktu import-nya. Lihat import_report.py.
 
 st.set_page_config(page_title="Job Market Analysis", page_icon="💻", layout="wide")
 
@@ -43,15 +39,164 @@ if page == "Home":
     )
 
 elif page == "Analisis Data":
+    import pandas as pd
+
+    import aggregates
+    import cluster_index
+    import datastore
+    import incremental
+    import ingest
+    import jobs
+    import metrics
+    import pipeline
+    import rendering
+    import schema
+    import skills
+    import table_view
+
     st.title("Analisis Pasar Kerja Berbasis AI 📊")
+
+    # Identitas sesi untuk antrean job clustering bersama
+    st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+    # Waktu dan memori setiap tahap rerun ini; ditampilkan di panel Performance di akhir halaman
+    recorder = metrics.Recorder("Analisis Data", session=st.session_state["session_id"]).start()
+    recorder.extend(st.session_state.pop("carried_spans", []))
+
+    # Dataset disimpan sekali per isi di penyimpanan bersama; session_state hanya berisi kuncinya
+    store = datastore.store()
+
+    def stored_frame(state_key, *overlays):
+        """Frame untuk kunci di session_state, atau None jika sudah dibuang dari penyimpanan."""
+        key = st.session_state.get(state_key)
+        if key is None:
+            return None
+        try:
+            return store.frame(key, *overlays)
+        except KeyError:
+            del st.session_state[state_key]
+            return None
+
+    def cluster_views(key, overlay):
+        def build():
+            clustered = store.frame(key, overlay)
+            return (
+                # Agregat untuk visualisasi dibangun sekali per hasil clustering
+                aggregates.AggregateCube(clustered),
+                # Indeks baris per cluster/industri/lokasi untuk rincian dan filter
+                cluster_index.ClusterIndex(clustered),
+                # Tokenisasi keterampilan sekali per dataset untuk word cloud dan Skill_Count
+                skills.SkillTable(clustered["Required_Skills"]),
+            )
+
+        return store.view(key, overlay, build)
+
+    def run_clustering_job(key, k, engine, progress):
+        # Span job dicatat terpisah dan ditampilkan pada rerun yang mengambil hasilnya
+        with metrics.Recorder("clustering_job") as job_recorder:
+            # Melakukan K-Means untuk k = 2..10 sekaligus (dimemo per dataset), lalu
+            # memakai model untuk k yang dipilih dari hasil sweep yang sama
+            with metrics.span("cluster", engine=engine, k=k):
+                result = pipeline.cluster(
+                    store.get(key), k, engine, max_workers=jobs.WORKERS_PER_JOB,
+                    progress=lambda fraction, message=None: progress(0.9 * fraction, message)
+                )
+            progress(0.9, "Membangun agregat dan indeks...")
+            overlay = f"cluster-{engine}-k{k}"
+            with metrics.span("cluster_views"):
+                store.add_overlay(key, overlay, result.df[["Cluster", "PCA1"]])
+                cluster_views(key, overlay)
+        # Frame dan matriks fitur tidak disimpan per sesi; model diringkas agar batch tambahan
+        # bisa memperbarui centroid dan inertia tanpa matriks fitur lama
+        model = incremental.IncrementalModel.from_model(result.model, result.X)
+        return key, overlay, result._replace(df=None, X=None, model=model), job_recorder.spans
+
+    def collect_clustering_job():
+        """Memindahkan hasil job clustering yang sudah selesai ke session_state."""
+        job = jobs.queue().get(st.session_state.get("cluster_job"))
+        if job is None:
+            # Job sudah dibuang dari antrean (misalnya server dimulai ulang)
+            st.session_state.pop("cluster_job", None)
+            return
+        if not job.finished:
+            return
+        jobs.queue().pop(job.id)
+        del st.session_state["cluster_job"]
+        if job.status == jobs.DONE:
+            key, overlay, result, job_spans = job.result
+            recorder.extend(job_spans, prefix="job.")
+            st.session_state["cluster_result"] = result
+            st.session_state["clustered_key"] = key  # Simpan hasil clustering
+            st.session_state["cluster_overlay"] = overlay
+            st.session_state["cluster_k"] = result.model.n_clusters
+        elif job.status == jobs.CANCELLED:
+            st.warning("Clustering dibatalkan.")
+        else:
+            st.error(f"Clustering gagal: {job.error}")
+
+    @st.fragment(run_every=1.0)
+    def clustering_progress():
+        job = jobs.queue().get(st.session_state.get("cluster_job"))
+        if job is None:
+            return
+        if job.finished:
+            # Rerun seluruh halaman agar hasil diambil oleh collect_clustering_job
+            st.rerun()
+        position = jobs.queue().position(job)
+        st.progress(job.progress, text=f"Menunggu giliran (antrean ke-{position})..." if position else job.message)
+        if st.button("Batalkan Clustering"):
+            jobs.queue().cancel(job.id)
+
+    def show_chart(chart, stage):
+        """Menampilkan grafik sambil mencatat waktu kirim dan (jika diambil sampelnya) ukuran payload-nya."""
+        fields = {"payload_bytes": metrics.payload_bytes(chart)} if metrics.sample_payload() else {}
+        with metrics.span(stage, **fields):
+            if isinstance(chart, bytes):
+                st.image(chart, use_container_width=True)
+            else:
+                st.plotly_chart(chart)
+
+    # Pengaturan render untuk grafik dengan satu titik per baris
+    with st.sidebar.expander("Pengaturan Render"):
+        render_modes = {
+            "Otomatis (WebGL + sampling)": rendering.MODE_AUTO,
+            "Heatmap 2-D": rendering.MODE_HEATMAP,
+            "Semua titik": rendering.MODE_FULL,
+        }
+        render_mode = render_modes[st.radio("Mode Render", list(render_modes))]
+        point_threshold = st.number_input(
+            "Batas Jumlah Titik", min_value=1_000, value=rendering.POINT_THRESHOLD, step=1_000
+        )
+    performance_panel = st.sidebar.expander("Performance")
+
     st.subheader("Upload Dataset")
 
-    # Upload file Excel
-    uploaded_file = st.file_uploader("Pilih file XLSX", type="xlsx")
+    # Upload file Excel, CSV, atau Parquet
+    uploaded_file = st.file_uploader("Pilih file XLSX, CSV, atau Parquet", type=list(ingest.READERS))
     if uploaded_file:
         st.markdown("---")
-        df = pd.read_excel(uploaded_file, engine="openpyxl")
-        st.dataframe(df)
+        reader = ingest.reader_for(uploaded_file.name)
+
+        def parse_upload(data):
+            progress_bar = st.progress(0.0, text="Membaca dataset...")
+            df = reader(data, progress=lambda fraction: progress_bar.progress(fraction, text="Membaca dataset..."))
+            progress_bar.empty()
+            return schema.apply_schema(df)
+
+        # Parsing hanya sekali per isi file; rerun berikutnya dibaca dari penyimpanan bersama
+        # atau, setelah server dimulai ulang, dari cache Parquet
+        with metrics.span("ingest"):
+            data = uploaded_file.getvalue()
+            dataset_key = ingest.content_hash(data)
+            if dataset_key not in store:
+                df, _, cache_hit = ingest.read_cached(data, parse_upload)
+                if cache_hit:
+                    # Menyelaraskan kategori dari cache dengan kamus kategori bersama
+                    df = schema.apply_schema(df)
+                store.put(dataset_key, df)
+            df = store.get(dataset_key)
+        with metrics.span("raw_table"):
+            table_view.paginated_table(df, key="raw_data", data_key=dataset_key)
 
         # Info Dataset
         if st.button("Info Dataset"):
@@ -61,6 +206,12 @@ elif page == "Analisis Data":
                 st.write(f"Jumlah Kolom: {df.shape[1]}")
                 st.write("### Tipe Data")
                 st.write(df.dtypes)
+                st.write("### Penggunaan Memori")
+                memory = df.attrs.get("memory", {})
+                if memory:
+                    st.write(f"Sebelum optimasi skema: {memory['before'] / 1024 ** 2:.2f} MB")
+                    st.write(f"Setelah optimasi skema: {memory['after'] / 1024 ** 2:.2f} MB")
+                    st.write(f"Penghematan: {memory['before'] / max(memory['after'], 1):.1f}x")
 
         # Preprocessing Data
         st.subheader("Preprocessing Data")
@@ -69,67 +220,91 @@ elif page == "Analisis Data":
             st.write("### Nilai yang Hilang (NaN) Sebelum Preprocessing:")
             st.write(df.isna().sum())  # Menampilkan jumlah nilai NaN untuk setiap kolom
 
-            # Menghapus nilai NaN
-            df = df.dropna()
+            # Menghapus nilai NaN dan normalisasi kolom Salary_USD (sekali per dataset)
+            preprocessed_key = f"{dataset_key}-preprocessed"
+            with metrics.span("preprocess"):
+                if preprocessed_key not in store:
+                    store.put(preprocessed_key, pipeline.preprocess(df))
+                df = store.get(preprocessed_key)
 
             # Menampilkan jumlah nilai NaN setelah penghapusan
             st.write("### Nilai yang Hilang (NaN) Setelah Preprocessing:")
             st.write(df.isna().sum())  # Memeriksa kembali apakah masih ada NaN
 
-            # Normalisasi kolom Salary_USD
-            scaler = StandardScaler()
-            columns_to_scale = ["Salary_USD"]
-            df[columns_to_scale] = scaler.fit_transform(df[columns_to_scale])
+            # Menyimpan kunci data yang telah diproses dalam session state
+            st.session_state["preprocessed_key"] = preprocessed_key
 
-            # Menyimpan data yang telah diproses dalam session state
-            st.session_state["preprocessed_data"] = df
-            
-            # Menampilkan data yang sudah diproses
+        # Menampilkan data yang sudah diproses (tetap tampil saat halaman tabel berganti)
+        preprocessed = stored_frame("preprocessed_key")
+        if preprocessed is not None:
             st.write("### Data setelah preprocessing (normalisasi gaji):")
-            st.dataframe(df)
+            with metrics.span("preprocessed_table"):
+                table_view.paginated_table(
+                    preprocessed, key="preprocessed_data", data_key=st.session_state["preprocessed_key"]
+                )
 
         # Clustering
         st.subheader("Analisis Data - Clustering")
 
         # Memastikan data sudah diproses sebelumnya
-        if st.session_state.get("preprocessed_data") is not None:
-            k = st.slider("Pilih Jumlah Cluster", 2, 10, 3)
+        clustered = None
+        if preprocessed is not None:
+            k = st.slider("Pilih Jumlah Cluster", pipeline.ELBOW_RANGE.start, pipeline.ELBOW_RANGE.stop - 1, 3)
+            engine_options = {
+                "K-Means Eksak 1-D (Ckmeans)": "exact",
+                "K-Means (scikit-learn)": "sklearn",
+                "MiniBatch K-Means Multi-Fitur": "minibatch",
+            }
+            engine = engine_options[st.radio("Metode Clustering", list(engine_options), horizontal=True)]
+            if engine == "minibatch":
+                st.caption(
+                    "Fitur: Salary_USD, Automation_Risk, AI_Adoption_Level, Industry, "
+                    "dan jumlah keterampilan (Required_Skills)."
+                )
 
             if st.button("Lakukan Clustering (K-Means)"):
-                # Mengambil data yang sudah diproses
-                df = st.session_state["preprocessed_data"].copy()
+                # Clustering berjalan di latar belakang; hasilnya diambil pada rerun berikutnya
+                job = jobs.queue().submit(
+                    st.session_state["session_id"], run_clustering_job,
+                    st.session_state["preprocessed_key"], k, engine
+                )
+                st.session_state["cluster_job"] = job.id
 
-                # Standarisasi data
-                scaler = StandardScaler()
-                df_scaled = scaler.fit_transform(df[["Salary_USD"]])
+            collect_clustering_job()
+            # Fragment memeriksa job setiap detik, jadi hanya dipasang selama ada job
+            if "cluster_job" in st.session_state:
+                clustering_progress()
 
-                # Melakukan K-Means clustering
-                model = KMeans(n_clusters=k, random_state=42)
-                df["Cluster"] = model.fit_predict(df_scaled)
-                st.session_state["clustered_data"] = df  # Simpan hasil clustering
+            clustered = stored_frame("clustered_key", st.session_state.get("cluster_overlay"))
+            if clustered is not None and "cluster_result" in st.session_state:
+                import charts
 
-                # Menampilkan data hasil clustering
-                st.write(f"Data dengan Cluster K-Means (k={k}):")
-                st.dataframe(df)
+                result = st.session_state["cluster_result"]
+                model = result.model
 
                 # Centroid cluster
                 st.write("Centroid Cluster:")
-                st.write(pd.DataFrame(model.cluster_centers_, columns=["Salary_USD"]))
+                st.write(pd.DataFrame(model.cluster_centers_, columns=result.feature_names))
 
                 # Evaluasi Clustering
                 # WCSS (Inertia)
                 inertia = model.inertia_
                 st.write(f"WCSS (Inertia): {inertia:.2f}")
-
-                # Silhouette Score
-                silhouette_avg = silhouette_score(df_scaled, model.labels_)
-                st.write(f"Silhouette Score: {silhouette_avg:.2f}")
-
-                # Menampilkan rincian untuk setiap cluster
-                for cluster_num in range(k):
-                    st.subheader(f"Rincian Cluster {cluster_num+1}")
-                    cluster_data = df[df["Cluster"] == cluster_num]
-                    st.dataframe(cluster_data)
+                if model.batches:
+                    st.caption(
+                        f"Centroid dan WCSS diperbarui dengan {model.batches} batch tambahan; "
+                        "Silhouette Score dan Elbow Method berasal dari clustering awal."
+                    )
+
+                # Silhouette Score (eksak untuk 1 fitur, estimasi sampel untuk data besar multi-fitur)
+                silhouette = result.silhouette
+                st.write(f"Silhouette Score: {silhouette.score:.2f}")
+                st.write(f"Metode Silhouette: {silhouette.method} ({silhouette.seconds:.2f} detik)")
+                if silhouette.ci_low is not None:
+                    st.write(
+                        f"Interval Kepercayaan 95%: {silhouette.ci_low:.2f} – {silhouette.ci_high:.2f} "
+                        f"(sampel {silhouette.sample_size} baris)"
+                    )
 
                 # Menambahkan penjelasan untuk setiap cluster
                 st.write("### Penjelasan Cluster:")
@@ -147,343 +322,253 @@ elif page == "Analisis Data":
                 }
 
                 # Menampilkan penjelasan untuk setiap cluster
-                for i in range(k):
+                for i in range(st.session_state["cluster_k"]):
                     st.write(f"Cluster {i+1}: {cluster_explanations.get(i, 'Penjelasan tidak tersedia')}")
 
-                # Visualisasi Clustering (PCA)
-                pca = PCA(n_components=1)
-                pca_result = pca.fit_transform(df_scaled)
-
-                # Menambahkan komponen PCA ke DataFrame
-                df['PCA1'] = pca_result[:, 0]
-
                 # Visualisasi PCA (tetap menggunakan komponen tunggal)
-                fig = px.scatter(df, x='PCA1', y='Salary_USD', color='Cluster', title="Visualisasi PCA (1 Komponen)")
-                st.plotly_chart(fig)
-
-                # Visualisasi Elbow Method (WCSS)
-                wcss_values = []
-                for i in range(2, 11):
-                    model_temp = KMeans(n_clusters=i, random_state=42)
-                    model_temp.fit(df_scaled)
-                    wcss_values.append(model_temp.inertia_)
-
-                elbow_fig = px.line(
-                    x=list(range(2, 11)),
-                    y=wcss_values,
-                    title="Elbow Method",
-                    labels={"x": "Jumlah Cluster", "y": "WCSS (Inertia)"}
-                )
-                st.plotly_chart(elbow_fig)
+                with metrics.span("pca_chart_build"):
+                    fig, point_note = charts.pca_figure(clustered, render_mode, point_threshold)
+                show_chart(fig, "pca_chart_render")
+                st.caption(point_note)
+
+                # Visualisasi Elbow Method (WCSS) dari hasil sweep yang sudah ada
+                elbow_fig = charts.elbow_figure(result.models, result.wcss)
+                show_chart(elbow_fig, "elbow_chart_render")
 
         else:
             st.info("Data belum diproses. Pastikan data sudah diproses sebelum melakukan clustering.")
 
+        if clustered is not None:
+            with metrics.span("cluster_views"):
+                cube, index, skill_table = cluster_views(
+                    st.session_state["clustered_key"], st.session_state["cluster_overlay"]
+                )
+            cluster_k = st.session_state.get("cluster_k", int(clustered["Cluster"].max()) + 1)
+            # Penanda isi frame hasil clustering untuk cache urutan tabel
+            clustered_version = (
+                st.session_state["clustered_key"], st.session_state["cluster_overlay"],
+                store.version(st.session_state["clustered_key"]),
+            )
+
+            # Batch tambahan: baris baru ditempatkan ke centroid yang ada tanpa preprocessing
+            # dan clustering ulang; agregat diperbarui per delta
+            with st.expander("Tambah Batch Data Baru"):
+                batch_file = st.file_uploader(
+                    "Pilih file batch XLSX, CSV, atau Parquet", type=list(ingest.READERS), key="append_batch"
+                )
+                refine = st.checkbox("Perbarui centroid dengan batch baru (partial fit)")
+                if batch_file and st.button("Tambahkan Batch"):
+                    with metrics.span("append_batch") as append_span:
+                        batch_data = batch_file.getvalue()
+                        batch = schema.apply_schema(ingest.reader_for(batch_file.name)(batch_data))
+                        try:
+                            combined, result, views = incremental.append_batch(
+                                clustered, st.session_state["cluster_result"], (cube, index, skill_table), batch, refine
+                            )
+                        except ValueError as exc:
+                            st.error(str(exc))
+                            combined = None
+                    if combined is not None:
+                        # Frame gabungan menjadi dataset baru di penyimpanan bersama
+                        key = ingest.content_hash(
+                            f"{st.session_state['clustered_key']}+{ingest.content_hash(batch_data)}".encode()
+                        )
+                        overlay = st.session_state["cluster_overlay"]
+                        store.put(key, combined.drop(columns=["Cluster", "PCA1"]))
+                        store.add_overlay(key, overlay, combined[["Cluster", "PCA1"]])
+                        store.view(key, overlay, lambda: views)
+                        st.session_state["preprocessed_key"] = key
+                        st.session_state["clustered_key"] = key
+                        st.session_state["cluster_result"] = result
+                        # Rerun ini dihentikan; span batch ditampilkan pada rerun berikutnya
+                        st.session_state["carried_spans"] = [append_span]
+                        st.rerun()
+
+            # Menampilkan data hasil clustering
+            st.write(f"Data dengan Cluster K-Means (k={cluster_k}):")
+            with metrics.span("clustered_table"):
+                table_view.paginated_table(clustered, key="clustered_data", data_key=clustered_version)
+
+            # Menampilkan rincian untuk cluster yang dipilih
+            cluster_num = st.selectbox(
+                "Rincian Cluster", range(cluster_k), format_func=lambda c: f"Cluster {c+1}"
+            )
+            st.subheader(f"Rincian Cluster {cluster_num+1}")
+            st.write("Statistik Cluster:")
+            with metrics.span("cluster_detail"):
+                st.dataframe(index.cluster_stats.rename(index=lambda c: f"Cluster {c+1}"))
+                table_view.paginated_table(
+                    clustered, key="cluster_detail", rows=index.rows(Cluster=[cluster_num]), data_key=clustered_version
+                )
+
+            # Query data berdasarkan cluster, industri, dan lokasi dari indeks
+            st.subheader("Filter Data berdasarkan Cluster, Industri, dan Lokasi")
+            query_cluster, query_industry, query_location = st.columns(3)
+            selected_clusters = query_cluster.multiselect(
+                "Cluster", index.values("Cluster"), format_func=lambda c: f"Cluster {c+1}"
+            )
+            selected_industries = query_industry.multiselect("Industri", index.values("Industry"))
+            selected_locations = query_location.multiselect("Lokasi", index.values("Location"))
+            with metrics.span("cluster_query"):
+                query_rows = index.rows(
+                    Cluster=selected_clusters, Industry=selected_industries, Location=selected_locations
+                )
+                salary = clustered["Salary_USD"].to_numpy()[query_rows]
+                st.write(
+                    f"Jumlah Pekerjaan: {query_rows.size:,}"
+                    + (f" — Rata-rata Salary_USD: {salary.mean():.2f}" if query_rows.size else "")
+                )
+                table_view.paginated_table(clustered, key="cluster_query", rows=query_rows, data_key=clustered_version)
+
         # Visualisasi Data
-        if "clustered_data" in st.session_state:
+        if clustered is not None:
+            import charts
+
             st.subheader("Visualisasi Data")
-            df = st.session_state["clustered_data"]
-            visual_options = [
-                "Distribusi Gaji berdasarkan Jabatan Pekerjaan",
-                "Perbandingan Gaji antar Industri",
-                "Hubungan antara Risiko Otomatisasi dan Gaji",
-                "Hubungan antara Ukuran Perusahaan dan Risiko Otomatisasi",
-                "Distribusi Lokasi Kerja Berdasarkan Remote Friendly dan Industri",
-                "Persentase Pekerjaan yang Mendukung Kerja Jarak Jauh",
-                "Distribusi Gaji berdasarkan Ukuran Perusahaan",
-                "Hubungan Proyeksi Pertumbuhan dengan Tingkat Adopsi AI",
-                "Keterampilan yang Paling Banyak Dibutuhkan",
-                "Distribusi Gaji Berdasarkan Lokasi",
-                "Rata-rata Gaji untuk Setiap Tingkat Adopsi AI",
-                "Perbandingan Risiko Otomatisasi di Berbagai Lokasi",
-                "Proyeksi Pertumbuhan Pekerjaan Berdasarkan Industri",
-                "Frekuensi Lokasi Kerja berdasarkan Remote Friendly",
-                "Distribusi Pekerjaan Berdasarkan Ukuran Perusahaan",
-                "Hubungan Gaji dengan Jumlah Keterampilan yang Dibutuhkan",
-                "Distribusi Jabatan Berdasarkan Industri",
-                "Korelasi antara Gaji dan Risiko Otomatisasi",
-                "Frekuensi Jabatan yang Mendukung Kerja Remote",
-                "Distribusi Gaji berdasarkan Proyeksi Pertumbuhan Pekerjaan",
-                "Frekuensi Jabatan Berdasarkan Industri",
-            ]
-            viz_choice = st.selectbox("Pilih Visualisasi", visual_options)
-
-            if viz_choice == visual_options[0]:
-                fig = px.histogram(
-                    df, 
-                    x='Salary_USD', 
-                    color='Job_Title', 
-                    title="Distribusi Gaji berdasarkan Jabatan Pekerjaan",
-                    nbins=30, 
-                    barmode='overlay'
-                )
-                st.plotly_chart(fig)
-                st.write("""
+            chart_context = charts.ChartContext(clustered, cube, skill_table, render_mode, point_threshold)
+
+            # Penjelasan untuk setiap visualisasi
+            viz_explanations = {
+                "Distribusi Gaji berdasarkan Jabatan Pekerjaan": """
                     **Penjelasan:**
-                    Grafik ini menunjukkan distribusi gaji berdasarkan jabatan pekerjaan. 
-                    Setiap warna mewakili jabatan yang berbeda. 
-                    Dapat dilihat bahwa jabatan tertentu memiliki distribusi gaji yang lebih tinggi, 
+                    Grafik ini menunjukkan distribusi gaji berdasarkan jabatan pekerjaan.
+                    Setiap warna mewakili jabatan yang berbeda.
+                    Dapat dilihat bahwa jabatan tertentu memiliki distribusi gaji yang lebih tinggi,
                     menandakan pekerjaan tersebut cenderung memiliki gaji yang lebih besar di pasar kerja.
-                """)
-
-            elif viz_choice == visual_options[1]:
-                fig = px.bar(df, x='Industry', y='Salary_USD', color='Cluster', title="Perbandingan Gaji antar Industri")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Perbandingan Gaji antar Industri": """
                     **Penjelasan:**
-                    Grafik batang ini membandingkan gaji rata-rata berdasarkan industri, dengan warna yang menunjukkan cluster yang berbeda. 
+                    Grafik batang ini membandingkan gaji rata-rata berdasarkan industri, dengan warna yang menunjukkan cluster yang berbeda.
                     Ini memberikan gambaran tentang bagaimana industri-industri berbeda dalam hal tingkat gaji pekerjaannya.
-                """)
-
-            elif viz_choice == visual_options[2]:
-                fig = px.scatter(df, x='Automation_Risk', y='Salary_USD', color='Cluster', title="Hubungan Risiko Otomatisasi dan Gaji")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Hubungan antara Risiko Otomatisasi dan Gaji": """
                     **Penjelasan:**
-                    Grafik pencar ini menunjukkan hubungan antara risiko otomatisasi dan gaji. 
-                    Titik-titik yang lebih tinggi di sumbu Y menunjukkan gaji yang lebih besar, 
-                    sedangkan posisi di sumbu X menunjukkan tingkat risiko otomatisasi. 
+                    Grafik pencar ini menunjukkan hubungan antara risiko otomatisasi dan gaji.
+                    Titik-titik yang lebih tinggi di sumbu Y menunjukkan gaji yang lebih besar,
+                    sedangkan posisi di sumbu X menunjukkan tingkat risiko otomatisasi.
                     Warna yang berbeda mewakili cluster yang teridentifikasi dalam data.
-                """)
-
-            elif viz_choice == visual_options[3]:
-                df['Salary_Size'] = df['Salary_USD'] + abs(df['Salary_USD'].min()) + 1
-                fig = px.scatter(
-                    df, x='Company_Size', y='Automation_Risk', size='Salary_Size', color='Industry',
-                    title="Hubungan antara Ukuran Perusahaan dan Risiko Otomatisasi",
-                    hover_data=['Job_Title']
-                )
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Hubungan antara Ukuran Perusahaan dan Risiko Otomatisasi": """
                     **Penjelasan:**
-                    Grafik pencar ini menggambarkan hubungan antara ukuran perusahaan dan risiko otomatisasi. 
-                    Ukuran titik menunjukkan besar gaji yang diterima di perusahaan tersebut, 
+                    Grafik pencar ini menggambarkan hubungan antara ukuran perusahaan dan risiko otomatisasi.
+                    Ukuran titik menunjukkan besar gaji yang diterima di perusahaan tersebut,
                     sementara warna mewakili industri tempat perusahaan beroperasi.
-                """)
-
-            elif viz_choice == visual_options[4]:
-                fig = px.bar(
-                    df, x='Location', color='Industry', barmode='stack',
-                    facet_col='Remote_Friendly', title="Distribusi Lokasi Kerja Berdasarkan Remote Friendly dan Industri"
-                )
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Lokasi Kerja Berdasarkan Remote Friendly dan Industri": """
                     **Penjelasan:**
-                    Grafik ini memperlihatkan distribusi lokasi pekerjaan yang berbeda berdasarkan dua kategori: 
-                    industri dan apakah pekerjaan tersebut mendukung kerja jarak jauh. 
+                    Grafik ini memperlihatkan distribusi lokasi pekerjaan yang berbeda berdasarkan dua kategori:
+                    industri dan apakah pekerjaan tersebut mendukung kerja jarak jauh.
                     Setiap batang menunjukkan jumlah pekerjaan di lokasi tertentu yang dibagi berdasarkan industri.
-                """)
-
-            elif viz_choice == visual_options[5]:
-                fig = px.pie(df, names='Remote_Friendly', title="Persentase Pekerjaan yang Mendukung Kerja Jarak Jauh")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Persentase Pekerjaan yang Mendukung Kerja Jarak Jauh": """
                     **Penjelasan:**
-                    Grafik pie ini menunjukkan persentase pekerjaan yang mendukung kerja jarak jauh dibandingkan dengan pekerjaan yang tidak. 
+                    Grafik pie ini menunjukkan persentase pekerjaan yang mendukung kerja jarak jauh dibandingkan dengan pekerjaan yang tidak.
                     Ini memberikan gambaran yang jelas tentang sejauh mana industri menerima kerja jarak jauh.
-                """)
-
-            elif viz_choice == visual_options[6]:
-                fig = px.box(df, x='Company_Size', y='Salary_USD', title="Distribusi Gaji berdasarkan Ukuran Perusahaan")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Gaji berdasarkan Ukuran Perusahaan": """
                     **Penjelasan:**
-                    Grafik boxplot ini menggambarkan distribusi gaji berdasarkan ukuran perusahaan. 
-                    Dari boxplot, kita dapat melihat variasi gaji untuk perusahaan dengan ukuran yang berbeda. 
+                    Grafik boxplot ini menggambarkan distribusi gaji berdasarkan ukuran perusahaan.
+                    Dari boxplot, kita dapat melihat variasi gaji untuk perusahaan dengan ukuran yang berbeda.
                     Titik luar (outliers) menunjukkan gaji yang jauh lebih tinggi atau lebih rendah dari mayoritas.
-                """)
-
-            elif viz_choice == visual_options[7]:
-                fig = px.bar(df, x='AI_Adoption_Level', y='Job_Growth_Projection', color='Industry', title="Hubungan Proyeksi Pertumbuhan dengan Tingkat Adopsi AI")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Hubungan Proyeksi Pertumbuhan dengan Tingkat Adopsi AI": """
                     **Penjelasan:**
-                    Grafik batang ini menunjukkan hubungan antara tingkat adopsi AI dan proyeksi pertumbuhan pekerjaan, 
-                    dengan warna yang menunjukkan industri. 
-                    Ini memberikan wawasan tentang bagaimana industri-industri tertentu melihat perkembangan pekerjaan 
+                    Grafik batang ini menunjukkan hubungan antara tingkat adopsi AI dan proyeksi pertumbuhan pekerjaan,
+                    dengan warna yang menunjukkan industri.
+                    Ini memberikan wawasan tentang bagaimana industri-industri tertentu melihat perkembangan pekerjaan
                     terkait dengan adopsi AI.
-                """)
-
-            elif viz_choice == visual_options[8]:
-                skill_words = " ".join(df['Required_Skills'].dropna())
-                wordcloud = WordCloud(width=800, height=400).generate(skill_words)
-                plt.figure(figsize=(10, 5))
-                plt.imshow(wordcloud, interpolation='bilinear')
-                plt.axis('off')
-                st.pyplot(plt)
-                st.write("""
+                """,
+                "Keterampilan yang Paling Banyak Dibutuhkan": """
                     **Penjelasan:**
-                    Word cloud ini menampilkan keterampilan yang paling banyak dibutuhkan dalam pekerjaan yang ada. 
-                    Kata-kata yang lebih besar menunjukkan keterampilan yang lebih sering disebutkan dalam data, 
+                    Word cloud ini menampilkan keterampilan yang paling banyak dibutuhkan dalam pekerjaan yang ada.
+                    Kata-kata yang lebih besar menunjukkan keterampilan yang lebih sering disebutkan dalam data,
                     memberikan gambaran tentang keterampilan penting yang dicari oleh pemberi kerja.
-                """)
-
-            elif viz_choice == visual_options[9]:
-                fig = px.histogram(
-                    df, 
-                    x='Location', 
-                    y='Salary_USD', 
-                    title="Distribusi Gaji Berdasarkan Lokasi",
-                    nbins=30, 
-                    histfunc='avg' 
-                )
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Gaji Berdasarkan Lokasi": """
                     **Penjelasan:**
-                    Grafik histogram ini menunjukkan distribusi rata-rata gaji berdasarkan lokasi pekerjaan. 
+                    Grafik histogram ini menunjukkan distribusi rata-rata gaji berdasarkan lokasi pekerjaan.
                     Dengan menggunakan histogram, kita dapat melihat tren gaji di berbagai lokasi dan sektor.
-                """)
-
-            elif viz_choice == visual_options[10]:
-                avg_salary = df.groupby('AI_Adoption_Level')['Salary_USD'].mean().reset_index()
-                fig = px.bar(avg_salary, x='AI_Adoption_Level', y='Salary_USD', title="Rata-rata Gaji untuk Setiap Tingkat Adopsi AI")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Rata-rata Gaji untuk Setiap Tingkat Adopsi AI": """
                     **Penjelasan:**
-                    Grafik batang ini menunjukkan rata-rata gaji berdasarkan tingkat adopsi AI di berbagai industri. 
+                    Grafik batang ini menunjukkan rata-rata gaji berdasarkan tingkat adopsi AI di berbagai industri.
                     Dengan melihat grafik ini, kita bisa memahami bagaimana industri yang lebih banyak mengadopsi AI membayar lebih tinggi.
-                """)
-
-            elif viz_choice == visual_options[11]:
-                fig = px.bar(df, x='Location', y='Automation_Risk', color='Industry', barmode='group',
-                            title="Perbandingan Risiko Otomatisasi di Berbagai Lokasi")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Perbandingan Risiko Otomatisasi di Berbagai Lokasi": """
                     **Penjelasan:**
-                    Grafik batang ini membandingkan tingkat risiko otomatisasi di berbagai lokasi, dengan warna yang menunjukkan industri yang terlibat. 
+                    Grafik batang ini membandingkan tingkat risiko otomatisasi di berbagai lokasi, dengan warna yang menunjukkan industri yang terlibat.
                     Dapat dilihat bagaimana lokasi-lokasi tertentu menghadapi risiko otomatisasi yang lebih tinggi.
-                """)
-
-            elif viz_choice == visual_options[12]:
-                fig = px.bar(df, x='Industry', y='Job_Growth_Projection', color='Industry',
-                            title="Proyeksi Pertumbuhan Pekerjaan Berdasarkan Industri")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Proyeksi Pertumbuhan Pekerjaan Berdasarkan Industri": """
                     **Penjelasan:**
-                    Grafik batang ini menunjukkan proyeksi pertumbuhan pekerjaan berdasarkan industri. 
+                    Grafik batang ini menunjukkan proyeksi pertumbuhan pekerjaan berdasarkan industri.
                     Ini memberikan wawasan tentang industri mana yang diperkirakan akan mengalami peningkatan jumlah pekerjaan.
-                """)
-
-            elif viz_choice == visual_options[13]:
-                remote_counts = df['Remote_Friendly'].value_counts().reset_index()
-                remote_counts.columns = ['Remote_Friendly', 'Count']
-
-                fig = px.bar(
-                    remote_counts, 
-                    x='Remote_Friendly', 
-                    y='Count', 
-                    color='Remote_Friendly',
-                    title="Frekuensi Lokasi Kerja berdasarkan Remote Friendly",
-                    text='Count', 
-                    color_discrete_sequence=["#636EFA", "#EF553B", "#00CC96"] 
-                )
-
-                fig.update_layout(
-                    xaxis_title="Tipe Lokasi Kerja", 
-                    yaxis_title="Jumlah Frekuensi", 
-                    font=dict(size=14),  
-                    title_font=dict(size=18),  
-                    legend_title="Remote Friendly",  
-                )
-
-                fig.update_traces(
-                    texttemplate='%{text}',  
-                    textposition='outside',  
-                    marker=dict(line=dict(width=2, color='DarkSlateGrey'))  
-                )
-
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Frekuensi Lokasi Kerja berdasarkan Remote Friendly": """
                     **Penjelasan:**
-                    Grafik batang ini memperlihatkan frekuensi lokasi kerja berdasarkan apakah pekerjaan tersebut mendukung kerja jarak jauh atau tidak. 
+                    Grafik batang ini memperlihatkan frekuensi lokasi kerja berdasarkan apakah pekerjaan tersebut mendukung kerja jarak jauh atau tidak.
                     Dapat dilihat seberapa banyak pekerjaan yang tersedia di kategori ini di seluruh lokasi.
-                """)
-
-            elif viz_choice == visual_options[14]:
-                fig = px.pie(df, names='Company_Size', title="Distribusi Pekerjaan Berdasarkan Ukuran Perusahaan")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Pekerjaan Berdasarkan Ukuran Perusahaan": """
                     **Penjelasan:**
-                    Grafik pie ini menunjukkan distribusi pekerjaan berdasarkan ukuran perusahaan. 
+                    Grafik pie ini menunjukkan distribusi pekerjaan berdasarkan ukuran perusahaan.
                     Dengan ini, kita bisa melihat persentase pekerjaan yang berasal dari perusahaan kecil, menengah, atau besar.
-                """)
-
-            elif viz_choice == visual_options[15]:
-                df['Skill_Count'] = df['Required_Skills'].str.split().apply(len)
-                fig = px.scatter(
-                    df, x='Skill_Count', y='Salary_USD', color='Industry',
-                    title="Hubungan Gaji dengan Jumlah Keterampilan yang Dibutuhkan",
-                    hover_data=['Job_Title']
-                )
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Hubungan Gaji dengan Jumlah Keterampilan yang Dibutuhkan": """
                     **Penjelasan:**
-                    Grafik pencar ini menunjukkan hubungan antara jumlah keterampilan yang dibutuhkan dalam pekerjaan dan gaji yang diterima. 
+                    Grafik pencar ini menunjukkan hubungan antara jumlah keterampilan yang dibutuhkan dalam pekerjaan dan gaji yang diterima.
                     Titik-titik yang lebih tinggi di sumbu Y menunjukkan pekerjaan dengan gaji lebih tinggi, sementara sumbu X menunjukkan jumlah keterampilan yang dibutuhkan.
-                """)
-
-            elif viz_choice == visual_options[16]:
-                fig = px.bar(df, x='Industry', y='Job_Title', color='Industry', text='Job_Title', barmode='stack',
-                            title="Distribusi Jabatan Berdasarkan Industri")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Jabatan Berdasarkan Industri": """
                     **Penjelasan:**
-                    Grafik batang ini menunjukkan distribusi jabatan pekerjaan di berbagai industri. 
+                    Grafik batang ini menunjukkan distribusi jabatan pekerjaan di berbagai industri.
                     Masing-masing batang menunjukkan jumlah jabatan dalam kategori industri tertentu.
-                """)
-
-            elif viz_choice == visual_options[17]:
-                df['Automation_Risk_Numeric'] = df['Automation_Risk'].map({'Low': 1, 'Medium': 2, 'High': 3})
-
-                correlation_data = df[['Salary_USD', 'Automation_Risk_Numeric']].corr()
-
-                fig = px.imshow(correlation_data, text_auto=True, title="Korelasi antara Gaji dan Risiko Otomatisasi")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Korelasi antara Gaji dan Risiko Otomatisasi": """
                     **Penjelasan:**
-                    Grafik ini menunjukkan korelasi antara gaji dan tingkat risiko otomatisasi. 
+                    Grafik ini menunjukkan korelasi antara gaji dan tingkat risiko otomatisasi.
                     Nilai korelasi yang lebih tinggi menunjukkan hubungan yang lebih kuat antara dua variabel ini.
-                """)
-
-            elif viz_choice == visual_options[18]:
-                remote_jobs = df[df['Remote_Friendly'] == 'Yes']['Job_Title'].value_counts().reset_index()
-                remote_jobs.columns = ['Job_Title', 'Count']
-                fig = px.bar(remote_jobs, x='Job_Title', y='Count', title="Frekuensi Jabatan yang Mendukung Kerja Remote")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Frekuensi Jabatan yang Mendukung Kerja Remote": """
                     **Penjelasan:**
-                    Grafik batang ini menunjukkan frekuensi jabatan yang mendukung kerja jarak jauh. 
+                    Grafik batang ini menunjukkan frekuensi jabatan yang mendukung kerja jarak jauh.
                     Dapat dilihat jabatan mana yang lebih sering ditemukan di pekerjaan remote.
-                """)
-
-            elif viz_choice == visual_options[19]:
-                fig = px.violin(df, x='Job_Growth_Projection', y='Salary_USD', color='Cluster',
-                                title="Distribusi Gaji berdasarkan Proyeksi Pertumbuhan Pekerjaan")
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Distribusi Gaji berdasarkan Proyeksi Pertumbuhan Pekerjaan": """
                     **Penjelasan:**
-                    Grafik violin ini menunjukkan distribusi gaji berdasarkan proyeksi pertumbuhan pekerjaan. 
+                    Grafik violin ini menunjukkan distribusi gaji berdasarkan proyeksi pertumbuhan pekerjaan.
                     Tiap band menunjukkan distribusi gaji di kelompok proyeksi pertumbuhan pekerjaan yang berbeda, yang membantu memahami variasi gaji.
-                """)
-
-            elif viz_choice == visual_options[20]:
-                pivot_data = df.pivot_table(
-                    index='Industry',
-                    columns='Job_Title',
-                    values='Salary_USD',
-                    aggfunc='count',  
-                    fill_value=0 
-                )
-
-                fig = px.imshow(
-                    pivot_data,
-                    color_continuous_scale='Viridis', 
-                    labels=dict(x="Job Title", y="Industry", color="Frequency"),
-                    title="Frekuensi Jabatan Berdasarkan Industri"
-                )
-                st.plotly_chart(fig)
-                st.write("""
+                """,
+                "Frekuensi Jabatan Berdasarkan Industri": """
                     **Penjelasan:**
-                    Grafik ini menunjukkan frekuensi jabatan berdasarkan industri, dengan warna yang mencerminkan jumlah jabatan di industri tertentu. 
+                    Grafik ini menunjukkan frekuensi jabatan berdasarkan industri, dengan warna yang mencerminkan jumlah jabatan di industri tertentu.
                     Ini memberikan gambaran tentang industri mana yang memiliki lebih banyak jenis pekerjaan yang tersedia.
-                """)
+                """,
+            }
+            viz_choice = st.selectbox("Pilih Visualisasi", list(charts.CHARTS))
+
+            with metrics.span("chart_build", chart=viz_choice):
+                chart, point_note = charts.build(viz_choice, chart_context)
+            show_chart(chart, "chart_render")
+            if point_note:
+                st.caption(point_note)
+            st.write(viz_explanations[viz_choice])
+
+    # Panel Performance: rincian rerun ini dan rasio hit cache sejak server dimulai, lalu
+    # diekspor ke TECHNO_METRICS_PATH (Prometheus atau JSON lines) jika diisi
+    recorder.finish()
+    usage = store.usage()
+    caches = {**metrics.cache_stats(), "datastore": {"hits": usage["hits"], "misses": usage["misses"]}}
+    with performance_panel:
+        st.write(f"Rerun ini: {recorder.seconds:.2f} detik, RSS proses {metrics.rss_bytes() / 1024 ** 2:.0f} MB")
+        if recorder.spans:
+            st.dataframe(metrics.span_table(recorder), hide_index=True)
+        st.write("Rasio hit cache (sejak server dimulai):")
+        st.dataframe(metrics.cache_table(caches), hide_index=True)
+        st.caption(
+            f"Penyimpanan dataset: {usage['entries']} dataset, {usage['bytes'] / 1024 ** 2:.0f} MB di memori, "
+            f"{usage['spill_bytes'] / 1024 ** 2:.0f} MB di disk"
+        )
+    metrics.export(recorder, caches, {
+        "store_entries": usage["entries"], "store_bytes": usage["bytes"], "store_spill_bytes": usage["spill_bytes"],
+    })
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modul aplikasi berada di root repositori (tanpa paket)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,98 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+import clustering
+
+
+def _brute_force_wcss(x_sorted, k):
+    # Partisi optimal 1-D selalu berupa segmen berurutan pada data terurut
+    best = np.inf
+    for cuts in combinations(range(1, x_sorted.size), k - 1):
+        segments = np.split(x_sorted, cuts)
+        best = min(best, sum(((s - s.mean()) ** 2).sum() for s in segments))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dp_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    x = np.sort(np.concatenate([rng.normal(0, 1, 6), rng.normal(5, 2, 5), rng.integers(0, 3, 3)]))
+    wcss, _ = clustering._ckmeans_dp(x, 5)
+    for k in range(1, 6):
+        assert wcss[k - 1] == pytest.approx(_brute_force_wcss(x, k), rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_kmeans1d_labels_reach_optimal_wcss(k):
+    rng = np.random.default_rng(k)
+    x = rng.normal(90_000, 25_000, 13)
+    model = clustering.KMeans1D(n_clusters=k).fit(x.reshape(-1, 1))
+
+    centers = model.cluster_centers_[:, 0]
+    assert np.all(np.diff(centers) > 0)
+    assert ((x - centers[model.labels_]) ** 2).sum() == pytest.approx(model.inertia_, rel=1e-9)
+    assert model.inertia_ == pytest.approx(_brute_force_wcss(np.sort(x), k), rel=1e-9)
+    assert np.array_equal(model.predict(x), model.labels_)
+
+
+def test_wcss_1d_and_sweep_agree_with_single_fits():
+    x = np.random.default_rng(7).normal(0, 1, 200).reshape(-1, 1)
+    k_values = range(2, 7)
+    models = clustering.elbow_sweep(x, k_values, engine="exact")
+    wcss = clustering.wcss_1d(x, k_values)
+    for k, value in zip(k_values, wcss):
+        assert models[k].inertia_ == pytest.approx(value)
+        assert clustering.KMeans1D(n_clusters=k).fit(x).inertia_ == pytest.approx(value)
+
+
+@pytest.mark.parametrize("n", [3, 9])
+def test_exact_sweep_rejects_fewer_rows_than_k(n):
+    x = np.arange(float(n)).reshape(-1, 1)
+    with pytest.raises(ValueError, match="n_clusters=10"):
+        clustering.elbow_sweep(x, range(2, 11), engine="exact")
+
+
+@pytest.mark.parametrize("labels", [
+    np.repeat([0, 1, 2], [40, 35, 25]),
+    np.r_[np.zeros(99, dtype=int), 1],
+])
+def test_silhouette_1d_matches_sklearn(labels):
+    from sklearn.metrics import silhouette_score
+
+    x = np.sort(np.random.default_rng(3).normal(0, 1, labels.size)).reshape(-1, 1)
+    # Label diacak juga, agar hasil tidak bergantung pada cluster yang berurutan
+    shuffled = np.random.default_rng(4).permutation(labels)
+    for current in (labels, shuffled):
+        assert clustering.silhouette_1d(x, current) == pytest.approx(silhouette_score(x, current), abs=1e-12)
+
+
+def test_silhouette_1d_rejects_single_cluster():
+    with pytest.raises(ValueError):
+        clustering.silhouette_1d(np.arange(5.0), np.zeros(5))
+
+
+def test_sampled_silhouette_interval_covers_exact_score():
+    from sklearn.metrics import silhouette_score
+
+    rng = np.random.default_rng(5)
+    X = np.vstack([rng.normal(center, 1.0, (1500, 2)) for center in (0, 3, 6)])
+    labels = np.repeat([0, 1, 2], 1500)
+    exact = silhouette_score(X, labels)
+
+    result = clustering.silhouette(X, labels, sample_size=1000)
+    assert result.method == "sampel terstratifikasi"
+    assert result.sample_size == pytest.approx(1000, abs=3)
+    assert result.ci_low <= exact <= result.ci_high
+    assert result.score == pytest.approx(exact, abs=0.02)
+
+    assert clustering.silhouette(X, labels, sample_size=X.shape[0]).score == pytest.approx(exact)
+
+
+def test_sklearn_sweep_in_pool_matches_serial():
+    x = np.random.default_rng(8).normal(0, 1, 300).reshape(-1, 1)
+    pooled = clustering._sweep_sklearn(x, range(2, 5), max_workers=2)
+    serial = clustering._sweep_sklearn(x, range(2, 5), max_workers=1)
+    for k in range(2, 5):
+        assert pooled[k].inertia_ == pytest.approx(serial[k].inertia_)
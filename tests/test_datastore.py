@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import datastore
+
+
+def _frame(n=1_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Industry": pd.Categorical(rng.choice(["Tech", "Finance"], n)),
+        "Salary_USD": rng.normal(90_000, 20_000, n),
+    })
+
+
+def test_spill_and_reload_roundtrip(tmp_path):
+    store = datastore.DatasetStore(max_bytes=1, spill_dir=tmp_path)
+    a, b = _frame(seed=1), _frame(seed=2)
+    store.put("a", a)
+    store.add_overlay("a", "cluster", pd.DataFrame({"Cluster": np.arange(len(a)) % 3}, index=a.index))
+    store.put("b", b)
+
+    usage = store.usage()
+    assert usage["spills"] >= 1 and usage["in_memory"] == 1
+    assert (tmp_path / "a.parquet").exists()
+
+    reloaded = store.frame("a", "cluster")
+    assert usage["loads"] < store.usage()["loads"]
+    pd.testing.assert_series_equal(reloaded["Salary_USD"], a["Salary_USD"])
+    assert reloaded["Industry"].tolist() == a["Industry"].tolist()
+    assert (reloaded["Cluster"].to_numpy() == np.arange(len(a)) % 3).all()
+
+
+def test_views_are_rebuilt_after_spill(tmp_path):
+    store = datastore.DatasetStore(max_bytes=1, spill_dir=tmp_path)
+    store.put("a", _frame())
+    builds = []
+    store.view("a", "sum", lambda: builds.append(1) or 1)
+    store.put("b", _frame(seed=1))
+    store.view("a", "sum", lambda: builds.append(1) or 1)
+    assert len(builds) == 2
+
+
+def test_oldest_spilled_dataset_is_dropped(tmp_path):
+    store = datastore.DatasetStore(max_bytes=1, spill_dir=tmp_path, max_spill_bytes=1)
+    for key in "abc":
+        store.put(key, _frame(seed=ord(key)))
+
+    assert "a" not in store
+    assert store.usage()["drops"] >= 1
+    assert not (tmp_path / "a.parquet").exists()
+    with pytest.raises(KeyError):
+        store.get("a")
+    assert len(store.get("c")) == 1_000
+
+
+def test_unwritable_frame_stays_in_memory(tmp_path):
+    store = datastore.DatasetStore(max_bytes=1, spill_dir=tmp_path)
+    # Kolom object bertipe campuran seperti hasil read_xlsx tidak bisa ditulis ke Parquet
+    mixed = pd.DataFrame({"Salary_USD": [1.0, 2.0], "Note": [1, "a"]})
+    store.put("mixed", mixed)
+    store.put("b", _frame())
+    store.put("c", _frame(seed=1))
+    store.add_overlay("c", "cluster", pd.DataFrame({"Cluster": 0}, index=range(1_000)))
+
+    usage = store.usage()
+    assert usage["spill_errors"] == 1
+    assert usage["entries"] == 3
+    assert list(tmp_path.glob("mixed*")) == []
+    pd.testing.assert_frame_equal(store.get("mixed"), mixed)
+    assert len(store.frame("b")) == 1_000
+
+
+def test_version_changes_with_overlay(tmp_path):
+    store = datastore.DatasetStore(spill_dir=tmp_path)
+    df = store.put("a", _frame())
+    before = store.version("a")
+    store.add_overlay("a", "cluster", pd.DataFrame({"Cluster": 0}, index=df.index))
+    assert store.version("a") == before + 1
+
+
+def test_least_recently_used_dataset_is_spilled_first(tmp_path):
+    probe = datastore.DatasetStore(spill_dir=tmp_path / "probe")
+    probe.put("a", _frame())
+    store = datastore.DatasetStore(max_bytes=int(2.5 * probe.usage()["bytes"]), spill_dir=tmp_path)
+    store.put("a", _frame(seed=1))
+    store.put("b", _frame(seed=2))
+    store.get("a")
+    store.put("c", _frame(seed=3))
+
+    assert store.usage()["in_memory"] == 2
+    assert (tmp_path / "b.parquet").exists() and not (tmp_path / "a.parquet").exists()
+    loads = store.usage()["loads"]
+    store.get("a")
+    assert store.usage()["loads"] == loads
+    store.get("b")
+    assert store.usage()["loads"] == loads + 1
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+import features
+import schema
+
+
+def _frame(industries, n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return schema.apply_schema(pd.DataFrame({
+        "Salary_USD": rng.normal(90_000, 20_000, n),
+        "Automation_Risk": rng.choice(["Low", "Medium", "High"], n),
+        "AI_Adoption_Level": rng.choice(["Low", "Medium", "High"], n),
+        "Required_Skills": rng.choice(["Python", "SQL Python"], n),
+        "Industry": rng.choice(industries, n),
+    }))
+
+
+def test_layout_does_not_depend_on_other_uploads():
+    df = _frame(["Tech", "Finance"])
+    before = features.FeatureEncoder().fit_transform(df)
+
+    # Upload lain memperluas kamus kategori bersama di atas batas one-hot
+    schema.category_dtype("Industry", [f"Other industry {i}" for i in range(features.MAX_ONEHOT_CATEGORIES + 5)])
+    encoder = features.FeatureEncoder()
+    after = encoder.fit_transform(schema.apply_schema(df))
+
+    assert encoder.names[-2:] == ["Industry_Finance", "Industry_Tech"]
+    np.testing.assert_array_equal(before, after)
+
+
+def test_transform_uses_fitted_vocabulary():
+    encoder = features.FeatureEncoder()
+    X = encoder.fit_transform(_frame(["Tech", "Finance"]))
+    batch = _frame(["Tech", "Retail"], n=50, seed=1)
+    Y = encoder.transform(batch)
+
+    assert Y.shape[1] == X.shape[1]
+    industry = Y[:, -2:]
+    tech = (batch["Industry"] == "Tech").to_numpy()
+    np.testing.assert_array_equal(industry[tech], [[0.0, 1.0]] * tech.sum())
+    # Industri yang tidak ada saat fit tidak punya kolom
+    assert not industry[~tech].any()
+
+
+def test_many_industries_are_hashed():
+    industries = [f"Industry {i}" for i in range(features.MAX_ONEHOT_CATEGORIES + 1)]
+    encoder = features.FeatureEncoder()
+    X = encoder.fit_transform(_frame(industries, n=500))
+    assert X.shape[1] == 4 + features.HASH_BUCKETS
+    np.testing.assert_array_equal(X[:, 4:].sum(axis=1), 1.0)
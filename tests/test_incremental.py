@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import aggregates
+import cluster_index
+import incremental
+import pipeline
+import schema
+import skills
+
+
+def _dataset(n, seed=0, locations=("Berlin", "Tokyo")):
+    rng = np.random.default_rng(seed)
+    salary = rng.normal(90_000, 20_000, n)
+    salary[rng.random(n) < 0.02] = np.nan
+    return schema.apply_schema(pd.DataFrame({
+        "Job_Title": rng.choice(["Data Scientist", "HR Manager", "UX Designer"], n),
+        "Industry": rng.choice(["Tech", "Finance", "Retail"], n),
+        "Company_Size": rng.choice(["Small", "Medium", "Large"], n),
+        "Location": rng.choice(list(locations), n),
+        "AI_Adoption_Level": rng.choice(["Low", "Medium", "High"], n),
+        "Automation_Risk": rng.choice(["Low", "Medium", "High"], n),
+        "Required_Skills": rng.choice(["Python", "SQL", "Sales", "Python, SQL"], n),
+        "Salary_USD": salary,
+        "Remote_Friendly": rng.choice(["Yes", "No"], n),
+        "Job_Growth_Projection": rng.choice(["Growth", "Decline", "Stable"], n),
+    }))
+
+
+def _sorted(frame, dims):
+    return frame.sort_values(list(dims)).reset_index(drop=True)
+
+
+@pytest.fixture(params=["exact", "minibatch"])
+def appended(request):
+    """Hasil append_batch (tanpa dan dengan refine) beserta data lengkap sebagai pembanding."""
+    base = _dataset(600, seed=1)
+    # Batch membawa lokasi baru agar kategori ikut diselaraskan
+    batch = _dataset(150, seed=2, locations=("Berlin", "Tokyo", "Paris"))
+    result = pipeline.cluster(pipeline.preprocess(base), 3, request.param)
+    clustered = result.df
+    views = (aggregates.AggregateCube(clustered), cluster_index.ClusterIndex(clustered),
+             skills.SkillTable(clustered["Required_Skills"]))
+    model = incremental.IncrementalModel.from_model(result.model, result.X)
+    full = pipeline.preprocess(pd.concat([base, batch], ignore_index=True))
+
+    runs = {}
+    for refine in (False, True):
+        runs[refine] = incremental.append_batch(
+            clustered, result._replace(df=None, X=None, model=model), views, batch, refine=refine
+        )
+    return result, batch, full, runs
+
+
+def test_salary_and_scaler_match_full_preprocessing(appended):
+    _, _, full, runs = appended
+    for combined, _, _ in runs.values():
+        assert len(combined) == len(full)
+        np.testing.assert_allclose(combined["Salary_USD"].to_numpy(float), full["Salary_USD"].to_numpy(float),
+                                   rtol=1e-5, atol=1e-5)
+        assert combined.attrs["scaler"]["n_samples"] == full.attrs["scaler"]["n_samples"]
+        assert combined.attrs["scaler"]["mean"] == pytest.approx(full.attrs["scaler"]["mean"])
+        assert combined.attrs["scaler"]["var"] == pytest.approx(full.attrs["scaler"]["var"])
+
+
+def test_inertia_matches_distances_to_new_centers(appended):
+    result, batch, _, runs = appended
+    stats = result.df.attrs["scaler"]
+    rows = batch.dropna()
+    salary = (rows["Salary_USD"].to_numpy(float) - stats["mean"]) / np.sqrt(stats["var"])
+    X = np.vstack([np.asarray(result.X, float),
+                   np.asarray(result.encoder.transform(rows.assign(Salary_USD=salary)), float)])
+    for combined, new_result, _ in runs.values():
+        centers = new_result.model.cluster_centers_
+        sse = ((X - centers[combined["Cluster"].to_numpy()]) ** 2).sum()
+        # Inertia awal MiniBatchKMeans dihitung sklearn dalam float32
+        assert new_result.model.inertia_ == pytest.approx(sse, rel=1e-6)
+
+
+def test_views_match_rebuild_from_combined_frame(appended):
+    _, _, _, runs = appended
+    for combined, _, (cube, index, skill_table) in runs.values():
+        rebuilt = aggregates.AggregateCube(combined)
+        for dims in aggregates.BASE_CUBOIDS:
+            a, b = _sorted(cube.cuboid(*dims), dims), _sorted(rebuilt.cuboid(*dims), dims)
+            columns = ["Count", "Salary_Sum", "Salary_SumSq"]
+            assert a[list(dims)].astype(str).equals(b[list(dims)].astype(str))
+            np.testing.assert_allclose(a[columns].to_numpy(float), b[columns].to_numpy(float), atol=1e-6)
+        np.testing.assert_allclose(cube.box_stats().iloc[:, 1:].to_numpy(float),
+                                   rebuilt.box_stats().iloc[:, 1:].to_numpy(float), atol=1e-9)
+        assert cube.histogram()["Count"].sum() == len(combined)
+
+        fresh = cluster_index.ClusterIndex(combined)
+        for column in cluster_index.INDEX_COLUMNS:
+            assert set(index.values(column)) == set(fresh.values(column))
+        assert "Paris" in index.values("Location")
+        assert np.array_equal(np.sort(index.rows(Cluster=[0], Location=["Paris"])),
+                              np.sort(fresh.rows(Cluster=[0], Location=["Paris"])))
+        np.testing.assert_allclose(index.cluster_stats.iloc[:, :4].to_numpy(float),
+                                   fresh.cluster_stats.iloc[:, :4].to_numpy(float), atol=1e-9)
+        assert (index.cluster_stats.iloc[:, 4:] == fresh.cluster_stats.iloc[:, 4:]).all().all()
+
+        fresh_skills = skills.SkillTable(combined["Required_Skills"])
+        assert skill_table.frequencies.equals(fresh_skills.frequencies)
+        assert np.array_equal(skill_table.counts, fresh_skills.counts)
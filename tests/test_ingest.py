@@ -0,0 +1,46 @@
+import io
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+import ingest
+
+
+def _xlsx(rows) -> bytes:
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("header", [
+    ["A", "B", "A"],
+    ["A", "A", "A.1", "A"],
+    ["A", None, "B", None],
+    ["Unnamed: 1", None, "A", "A"],
+])
+def test_read_xlsx_matches_read_excel(header):
+    data = _xlsx([header, *([i, i * 10, i * 100, f"x{i}"][:len(header)] for i in range(5))])
+    expected = pd.read_excel(io.BytesIO(data))
+    result = ingest.read_xlsx(data, chunk_rows=2)
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_read_cached_parses_once(tmp_path):
+    calls = []
+
+    def parse(data):
+        calls.append(data)
+        return pd.DataFrame({"x": [1, 2, 3]})
+
+    first, key, hit = ingest.read_cached(b"abc", parse, cache_dir=tmp_path)
+    second, second_key, second_hit = ingest.read_cached(b"abc", parse, cache_dir=tmp_path)
+    assert (hit, second_hit) == (False, True)
+    assert key == second_key == ingest.content_hash(b"abc")
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+import jobs
+
+
+def _wait(job, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, "job tidak selesai"
+        time.sleep(0.01)
+    return job
+
+
+def _blocking(release, started=None):
+    def fn(progress):
+        if started is not None:
+            started.set()
+        while not release.wait(0.01):
+            progress(0.5, "Berjalan...")
+        return "hasil"
+
+    return fn
+
+
+@pytest.fixture
+def queue():
+    return jobs.JobQueue(max_workers=1)
+
+
+def test_job_result_and_progress(queue):
+    job = _wait(queue.submit("a", lambda x, progress: progress(0.5) or x * 2, 21))
+    assert (job.status, job.result, job.progress) == (jobs.DONE, 42, 1.0)
+    assert job.finished_at is not None
+
+
+def test_failed_job_keeps_error(queue):
+    def fn(progress):
+        raise ValueError("rusak")
+
+    job = _wait(queue.submit("a", fn))
+    assert job.status == jobs.FAILED
+    assert isinstance(job.error, ValueError)
+
+
+def test_cancel_running_job(queue):
+    release, started = threading.Event(), threading.Event()
+    job = queue.submit("a", _blocking(release, started))
+    assert started.wait(5)
+    queue.cancel(job.id)
+    assert _wait(job).status == jobs.CANCELLED
+    release.set()
+
+
+def test_new_job_replaces_pending_job_of_same_owner(queue):
+    release, started = threading.Event(), threading.Event()
+    running = queue.submit("a", _blocking(release, started))
+    assert started.wait(5)
+    first = queue.submit("b", lambda progress: 1)
+    assert queue.position(first) == 1
+    second = queue.submit("b", lambda progress: 2)
+
+    assert first.status == jobs.CANCELLED
+    assert queue.position(second) == 1
+    release.set()
+    assert _wait(running).status == jobs.DONE
+    assert _wait(second).result == 2
+
+
+def test_concurrency_limit():
+    queue = jobs.JobQueue(max_workers=2)
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def fn(progress):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    submitted = [queue.submit(owner, fn) for owner in "abcde"]
+    for job in submitted:
+        _wait(job)
+    assert peak[0] == 2
+
+
+def test_prune_ignores_job_without_finish_time(queue, monkeypatch):
+    job = _wait(queue.submit("a", lambda progress: 1))
+    # Status akhir tanpa finished_at (keadaan antara) tidak boleh membuat submit gagal
+    job.finished_at = None
+    monkeypatch.setattr(jobs, "FINISHED_JOB_TTL", -1)
+    _wait(queue.submit("b", lambda progress: 2))
+    assert queue.get(job.id) is job
@@ -0,0 +1,69 @@
+import json
+
+import metrics
+
+
+def test_spans_are_recorded_in_start_order():
+    with metrics.Recorder("page") as recorder:
+        with metrics.span("outer"):
+            with metrics.span("inner", engine="exact"):
+                pass
+        with metrics.span("after") as record:
+            record["rows"] = 3
+
+    assert [(span["name"], span["depth"]) for span in recorder.spans] == [("outer", 0), ("inner", 1), ("after", 0)]
+    assert recorder.spans[1]["engine"] == "exact" and recorder.spans[2]["rows"] == 3
+    assert all(span["seconds"] >= 0 for span in recorder.spans)
+    assert recorder.seconds >= recorder.spans[0]["seconds"]
+
+
+def test_span_without_recorder_is_a_no_op():
+    with metrics.span("alone", payload_bytes=1) as record:
+        pass
+    assert record == {"payload_bytes": 1}
+
+
+def test_payload_sampling():
+    assert not metrics.sample_payload(0.0)
+    assert metrics.sample_payload(1.0)
+
+
+def _recorded():
+    with metrics.Recorder("Analisis Data", session="s1") as recorder:
+        with metrics.span("chart_render", payload_bytes=2048):
+            pass
+        with metrics.span('ingest "x"'):
+            pass
+    return recorder
+
+
+def test_export_json_lines(tmp_path):
+    path = tmp_path / "metrics-{pid}.jsonl"
+    recorder = _recorded()
+    caches = {"ingest": {"hits": 1, "misses": 1}}
+    metrics.export(recorder, caches, {"store_bytes": 10}, path=path)
+    metrics.export(recorder, caches, path=path)
+
+    [target] = tmp_path.glob("metrics-*.jsonl")
+    records = [json.loads(line) for line in target.read_text().splitlines()]
+    assert len(records) == 2
+    assert records[0]["session"] == "s1" and records[0]["store_bytes"] == 10
+    assert [span["name"] for span in records[0]["spans"]] == ["chart_render", 'ingest "x"']
+    assert records[0]["caches"] == caches
+
+
+def test_export_prometheus(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "_totals", {"reruns": {}, "stages": {}})
+    path = tmp_path / "techno.prom"
+    recorder = _recorded()
+    for _ in range(2):
+        metrics.export(recorder, {"ingest": {"hits": 3, "misses": 1}}, {"store_bytes": 10}, path=path)
+
+    lines = path.read_text().splitlines()
+    assert 'techno_reruns_total{page="Analisis Data"} 2' in lines
+    assert 'techno_stage_seconds_count{stage="chart_render"} 2' in lines
+    assert 'techno_stage_payload_bytes_sum{stage="chart_render"} 4096' in lines
+    assert 'techno_stage_seconds_count{stage="ingest \\"x\\""} 2' in lines
+    assert 'techno_cache_hits_total{cache="ingest"} 3' in lines
+    assert "techno_store_bytes 10" in lines
+    assert not list(tmp_path.glob(".*.tmp"))
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pipeline
+
+
+def _dataset(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Job_Title": rng.choice(["Data Scientist", "HR Manager"], n),
+        "Industry": rng.choice(["Tech", "Finance"], n),
+        "Company_Size": rng.choice(["Small", "Medium", "Large"], n),
+        "Location": rng.choice(["Berlin", "Tokyo"], n),
+        "AI_Adoption_Level": rng.choice(["Low", "Medium", "High"], n),
+        "Automation_Risk": rng.choice(["Low", "Medium", "High"], n),
+        "Required_Skills": rng.choice(["Python", "SQL", "Sales"], n),
+        "Salary_USD": rng.normal(90_000, 20_000, n),
+        "Remote_Friendly": rng.choice(["Yes", "No"], n),
+        "Job_Growth_Projection": rng.choice(["Growth", "Decline", "Stable"], n),
+    })
+
+
+def test_same_stem_different_format_do_not_overwrite(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline.ingest, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(pipeline, "write_charts", lambda result, directory, *args: [])
+    _dataset(seed=1).to_csv(tmp_path / "a.csv", index=False)
+    _dataset(seed=2).to_parquet(tmp_path / "a.parquet", index=False)
+
+    assert pipeline.main([str(tmp_path / "a.csv"), str(tmp_path / "a.parquet"), "-o", str(tmp_path / "out"),
+                          "-j", "1"]) == 0
+    assert (tmp_path / "out" / "a.csv" / "metrics.json").exists()
+    assert (tmp_path / "out" / "a.parquet" / "metrics.json").exists()
+
+
+def test_same_name_from_different_folders_is_rejected(tmp_path):
+    for folder in ("x", "y"):
+        (tmp_path / folder).mkdir()
+        _dataset().to_csv(tmp_path / folder / "data.csv", index=False)
+    with pytest.raises(SystemExit):
+        pipeline.main([str(tmp_path / "x"), str(tmp_path / "y"), "-o", str(tmp_path / "out")])
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,15 @@
+import numpy as np
+import pandas as pd
+
+import pipeline
+import schema
+
+
+def test_non_numeric_salary_becomes_nan_and_is_dropped():
+    df = schema.apply_schema(pd.DataFrame({
+        "Industry": ["Tech", "Finance", "Tech"],
+        "Salary_USD": ["90000", "n/a", 120000.5],
+    }))
+    assert df["Salary_USD"].dtype == np.float32
+    assert df["Salary_USD"].isna().tolist() == [False, True, False]
+    assert len(pipeline.preprocess(df)) == 2
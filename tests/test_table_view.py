@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import table_view
+
+
+@pytest.fixture(autouse=True)
+def session_state(monkeypatch):
+    state = {}
+    monkeypatch.setattr(table_view.st, "session_state", state)
+    return state
+
+
+def test_sort_order_reused_for_same_data_key():
+    df = pd.DataFrame({"x": [3, 1, 2]})
+    first = table_view._sort_order(df, "x", False, "t", data_key=("a", 0))
+    # Frame baru (misalnya salinan dangkal dari penyimpanan pada rerun berikutnya)
+    second = table_view._sort_order(df.copy(deep=False), "x", False, "t", data_key=("a", 0))
+    assert second is first
+    np.testing.assert_array_equal(first, [1, 2, 0])
+
+
+def test_sort_order_recomputed_for_new_version():
+    df = pd.DataFrame({"x": [3, 1, 2]})
+    table_view._sort_order(df, "x", False, "t", data_key=("a", 0))
+    other = pd.DataFrame({"x": [1, 2, 3]})
+    np.testing.assert_array_equal(table_view._sort_order(other, "x", False, "t", data_key=("a", 1)), [0, 1, 2])
+
+
+def test_sort_order_without_data_key_never_returns_stale_order():
+    df = pd.DataFrame({"x": [3, 1, 2]})
+    first = table_view._sort_order(df, "x", True, "t")
+    assert table_view._sort_order(df, "x", True, "t") is first
+    del df
+    # Frame lain dengan panjang sama, mungkin dengan id() yang sama
+    other = pd.DataFrame({"x": [1, 2, 3]})
+    np.testing.assert_array_equal(table_view._sort_order(other, "x", True, "t"), [2, 1, 0])